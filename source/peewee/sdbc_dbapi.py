@@ -37,6 +37,7 @@ from com.sun.star.sdbc import DataType
 import warnings
 from decimal import Decimal, InvalidOperation
 import datetime
+import re
 
 import logging
 
@@ -149,6 +150,81 @@ _PY_TYPE_MAP = {
     _datetime.datetime: DATETIME,
 }
 
+# SDBC DataType constants bound at module level so the per-cell type
+# dispatch compares plain ints instead of resolving DataType attributes
+_DT_VARCHAR = DataType.VARCHAR
+_DT_CHAR = DataType.CHAR
+_DT_LONGVARCHAR = DataType.LONGVARCHAR
+_DT_INTEGER = DataType.INTEGER
+_DT_SMALLINT = DataType.SMALLINT
+_DT_TINYINT = DataType.TINYINT
+_DT_BIGINT = DataType.BIGINT
+_DT_DOUBLE = DataType.DOUBLE
+_DT_FLOAT = DataType.FLOAT
+_DT_REAL = DataType.REAL
+_DT_BOOLEAN = DataType.BOOLEAN
+_DT_DATE = DataType.DATE
+_DT_TIME = DataType.TIME
+_DT_TIMESTAMP = DataType.TIMESTAMP
+_DT_NUMERIC = DataType.NUMERIC
+_DT_DECIMAL = DataType.DECIMAL
+_DT_BINARY = DataType.BINARY
+_DT_VARBINARY = DataType.VARBINARY
+_DT_LONGVARBINARY = DataType.LONGVARBINARY
+_DT_BLOB = DataType.BLOB
+
+# Python and DB-API type objects accepted by Cursor.create_parameter_types,
+# mapped to the SDBC DataType used as the parameter type hint.
+# float, bool and Decimal compare equal to NUMBER and DATETIME to
+# datetime.date (see _DbType.__eq__), so the old if/elif chain resolved
+# them to INTEGER and DATE; the table keeps those results.
+_PYTYPE_TO_SDBC = {
+    int: _DT_INTEGER,
+    NUMBER: _DT_INTEGER,
+    float: _DT_INTEGER,
+    str: _DT_VARCHAR,
+    STRING: _DT_VARCHAR,
+    bool: _DT_INTEGER,
+    _datetime.date: _DT_DATE,
+    _datetime.time: _DT_TIME,
+    _datetime.datetime: _DT_TIMESTAMP,
+    DATETIME: _DT_DATE,
+    bytes: _DT_BLOB,
+    bytearray: _DT_BLOB,
+    BINARY: _DT_BLOB,
+    _Decimal: _DT_INTEGER,
+    # PostgreSQL doesn't have a direct ROWID type, use VARCHAR
+    ROWID: _DT_VARCHAR,
+}
+
+# Leading "YYYY-MM-DD HH:MM[:SS]" of a timestamp string; fractional seconds
+# and zone suffixes are ignored
+_TIMESTAMP_RE = re.compile(r'(\d+)-(\d+)-(\d+) (\d+):(\d+)(?::(\d+))?')
+
+# Types whose readers already turn NULL into None (structured values check
+# wasNull() themselves, string-parsed ones map the empty string), so the
+# row builders skip their own wasNull() round-trip for these columns
+_NULL_AWARE_TYPES = frozenset((
+    _DT_DATE, _DT_TIME, _DT_TIMESTAMP, _DT_NUMERIC, _DT_DECIMAL,
+))
+
+# Types that getObject may return directly as native Python values, with
+# the Python type expected for each. A type is only read with getObject once
+# the connection has seen its driver return the expected Python type for
+# that type code (see Cursor._probe_object_reads).
+_OBJECT_READ_TYPES = {
+    _DT_VARCHAR: str,
+    _DT_CHAR: str,
+    _DT_LONGVARCHAR: str,
+    _DT_INTEGER: int,
+    _DT_SMALLINT: int,
+    _DT_TINYINT: int,
+    _DT_DOUBLE: float,
+    _DT_FLOAT: float,
+    _DT_REAL: float,
+    _DT_BOOLEAN: bool,
+}
+
 # Exception hierarchy
 class Warning(Exception):
     """Raised for important warnings"""
@@ -317,6 +393,117 @@ def Binary(string):
     """Construct an object capable of holding a binary (long) string value."""
     return bytes(string)
 
+# Result set value readers
+#
+# Each reader takes the SDBC result set and a 1-based column index and
+# returns the converted Python value. NULL detection via wasNull() is left
+# to the caller unless the reader needs it to build a structured value.
+def _read_string(rs, index):
+    return rs.getString(index)
+
+def _read_int(rs, index):
+    return rs.getInt(index)
+
+def _read_bigint(rs, index):
+    # XRow.getLong returns a 64-bit hyper, which always holds a BIGINT
+    return rs.getLong(index)
+
+def _read_bigint_text(rs, index):
+    # For result sets without getLong, parse the string form instead
+    big_int_str = rs.getString(index)
+    return int(big_int_str) if big_int_str else 0
+
+def _read_double(rs, index):
+    return rs.getDouble(index)
+
+def _read_boolean(rs, index):
+    return rs.getBoolean(index)
+
+def _read_date(rs, index):
+    sdbc_date = rs.getDate(index)
+    if rs.wasNull():
+        return None
+    return Date(sdbc_date.Year, sdbc_date.Month, sdbc_date.Day)
+
+def _read_time(rs, index):
+    sdbc_time = rs.getTime(index)
+    if rs.wasNull():
+        return None
+    return Time(sdbc_time.Hours, sdbc_time.Minutes, sdbc_time.Seconds)
+
+def _read_timestamp(rs, index):
+    sdbc_timestamp = rs.getTimestamp(index)
+    if rs.wasNull():
+        return None
+    return Timestamp(
+        sdbc_timestamp.Year,
+        sdbc_timestamp.Month,
+        sdbc_timestamp.Day,
+        sdbc_timestamp.Hours,
+        sdbc_timestamp.Minutes,
+        sdbc_timestamp.Seconds
+    )
+
+def _read_timestamp_text(rs, index):
+    # String parsing for drivers that can't return timestamp structures
+    timestamp_str = rs.getString(index)
+    if not timestamp_str:
+        return None
+    match = _TIMESTAMP_RE.match(timestamp_str)
+    if match is None:
+        return timestamp_str
+    year, month, day, hour, minute, second = match.groups()
+    return Timestamp(int(year), int(month), int(day),
+                     int(hour), int(minute), int(second or 0))
+
+def _read_decimal(rs, index):
+    # Get numeric/decimal as string and convert to maintain precision.
+    # NULL yields an empty string here, mapped to None, so the row builders
+    # skip wasNull() for these types (see _NULL_AWARE_TYPES).
+    val_str = rs.getString(index)
+    if not val_str:
+        return None
+    try:
+        return Decimal(val_str)
+    except (ValueError, InvalidOperation):
+        return float(val_str)
+
+def _read_object(rs, index):
+    # A single UNO call that yields None for NULL, so no wasNull() is needed
+    return rs.getObject(index, None)
+
+def _read_bytes(rs, index):
+    # uno.ByteSequence keeps its payload as an immutable bytes object in
+    # .value; return that directly instead of copying it byte by byte
+    seq = rs.getBytes(index)
+    value = getattr(seq, 'value', seq)
+    return value if type(value) is bytes else bytes(value)
+
+# Dispatch table from SDBC type code to reader; unknown types fall back
+# to _read_string
+_VALUE_READERS = {
+    _DT_VARCHAR: _read_string,
+    _DT_CHAR: _read_string,
+    _DT_LONGVARCHAR: _read_string,
+    _DT_INTEGER: _read_int,
+    _DT_SMALLINT: _read_int,
+    _DT_TINYINT: _read_int,
+    _DT_BIGINT: _read_bigint,
+    _DT_DOUBLE: _read_double,
+    _DT_FLOAT: _read_double,
+    _DT_REAL: _read_double,
+    _DT_BOOLEAN: _read_boolean,
+    _DT_DATE: _read_date,
+    _DT_TIME: _read_time,
+    # TIMESTAMP is resolved per connection by Cursor._resolve_reader
+    _DT_NUMERIC: _read_decimal,
+    _DT_DECIMAL: _read_decimal,
+    _DT_BINARY: _read_bytes,
+    _DT_VARBINARY: _read_bytes,
+    _DT_LONGVARBINARY: _read_bytes,
+    _DT_BLOB: _read_bytes,
+}
+
 # Connection function
 def connect(dsn=None, user=None, password=None, host=None, database=None, port=5432, connect_timeout=5):
     """
@@ -402,6 +589,12 @@ class Connection:
         """
         self._conn = sdbc_connection
         self.closed = False
+        # Cleared the first time the driver fails to return a timestamp
+        # structure, so later cursors parse TIMESTAMP columns as strings
+        self._timestamp_native = True
+        # Per SDBC type code, whether getObject returns the native Python
+        # value for that type; type codes not probed yet are absent
+        self._object_reads = {}
         
         # Add required DB-API 2.0 attributes
         self.Error = Error
@@ -614,9 +807,18 @@ class Cursor:
         """
         self.connection = connection
         self._statement = None
+        self._prepared_sql = None  # SQL of self._statement when it is a reusable prepared statement
         self._resultset = None
         self.description = None
-        self._cached_meta = None  # Cache for column metadata to avoid repeated lookups
+        # Per-column metadata cached by _update_description to avoid repeated lookups
+        self._type_codes = []   # Raw SDBC DataType constants
+        self._col_names = []
+        self._precisions = []
+        self._scales = []
+        self._readers = []      # Value reader per column, see _resolve_reader
+        self._null_checks = []  # False where the reader already maps NULL to None
+        self._probe_pending = False  # getObject support still to be checked on a row
+        self._row_scratch = []  # Reusable per-row buffer, sized in _update_description
         self.rowcount = -1
         self.arraysize = 1000  # Default to a larger batch size for better performance
         self._row_cache = []   # Cache for fetched rows
@@ -649,10 +851,18 @@ class Cursor:
                     logger.warning(f"Error closing statement: {e}")
                 finally:
                     self._statement = None
+                    self._prepared_sql = None
             
             # Reset cursor state to initial values
             self.description = None
-            self._cached_meta = None
+            self._type_codes = []
+            self._col_names = []
+            self._precisions = []
+            self._scales = []
+            self._readers = []
+            self._null_checks = []
+            self._probe_pending = False
+            self._row_scratch = []
             self.rowcount = -1
             
             # Clear the row cache to release memory
@@ -739,13 +949,17 @@ class Cursor:
             raise ProgrammingError("Cursor is closed")
             
         try:
-            # Close any existing resultset and statement
+            # Close any existing resultset and statement. A prepared statement
+            # for the same SQL is kept so repeated executions on this cursor
+            # (executemany) skip re-preparing it. peewee's execute_sql opens a
+            # new cursor per query, so ordinary queries don't benefit.
             if self._resultset is not None:
                 self._resultset.close()
                 self._resultset = None
-            if self._statement is not None:
+            if self._statement is not None and not (parameters and operation == self._prepared_sql):
                 self._statement.close()
                 self._statement = None
+                self._prepared_sql = None
             
             # Set initial rowcount
             self.rowcount = -1
@@ -782,9 +996,13 @@ class Cursor:
                     if not sql or not sql.strip(): # Only check if SQL is genuinely empty or just whitespace
                         raise ProgrammingError("Invalid SQL statement: SQL string is empty")
                     
-                    # Create and prepare the statement
+                    # Create and prepare the statement, or reuse the one kept above
                     try:
-                        self._statement = self.connection._conn.prepareStatement(sql)
+                        if self._statement is None:
+                            self._statement = self.connection._conn.prepareStatement(sql)
+                            self._prepared_sql = sql
+                        else:
+                            self._statement.clearParameters()
                     except UnoException as e:
                         raise _map_sdbc_error(e)
                     
@@ -865,6 +1083,7 @@ class Cursor:
               2. Using reasonable batch sizes (1000-5000 rows)
               3. Explicitly committing after executemany completes
             - Each parameter set is executed individually, not as a true batch operation
+            - The statement is prepared once and reused for every parameter set
             - Total rowcount is the sum of affected rows from all operations
             
         Error Handling:
@@ -1148,8 +1367,7 @@ class Cursor:
         
         # Then fetch all remaining rows
         try:
-            while self._resultset.next():
-                result.append(self._get_row())
+            result.extend(self._fetchall_fast())
         except UnoException as e:
             raise _map_sdbc_error(e)
             
@@ -1159,6 +1377,53 @@ class Cursor:
             
         return result
         
+    def _fetchall_fast(self):
+        """
+        Read every remaining row of the result set.
+        
+        Equivalent to calling next() and _get_row() in a loop, but the result
+        set methods and per-column readers are bound to locals once so the
+        per-cell work avoids repeated attribute lookups.
+        
+        Returns:
+            list: Remaining rows as tuples
+        """
+        if not self._readers:
+            self._update_description()
+            
+        rs = self._resultset
+        rows = []
+        
+        # Read the first row through _get_row, which probes getObject
+        # support, so the loop below binds the final readers
+        if self._probe_pending:
+            if not rs.next():
+                return rows
+            rows.append(self._get_row())
+            
+        next_row = rs.next
+        was_null = rs.wasNull
+        get_string = rs.getString
+        readers = self._readers
+        columns = tuple(zip(range(len(readers)), readers, self._null_checks))
+        
+        # One preallocated buffer for the whole fetch; each row is written
+        # by position and only the final tuple is allocated
+        row = [None] * len(columns)
+        append_row = rows.append
+        while next_row():
+            for pos, read, check_null in columns:
+                i = pos + 1
+                try:
+                    value = read(rs, i)
+                except UnoException:
+                    # Fall back to string as a last resort
+                    value = get_string(i)
+                    check_null = True
+                row[pos] = None if check_null and was_null() else value
+            append_row(tuple(row))
+        return rows
+        
     def _convert_parameters(self, operation, parameters):
         """
         Validate parameters for qmark style used by this driver.
@@ -1424,17 +1689,22 @@ class Cursor:
                 self.description = []
                 
                 # Initialize the column metadata cache
-                self._cached_meta = {'types': [], 'names': [], 'precision': [], 'scale': []}
+                self._type_codes = []
+                self._col_names = []
+                self._precisions = []
+                self._scales = []
+                self._readers = []
+                self._null_checks = []
                 
                 for i in range(1, column_count + 1):
                     name = metadata.getColumnName(i)
                     sdbc_type_code = metadata.getColumnType(i)
                     
                     # Store the raw SDBC type code in our cache for faster lookups
-                    self._cached_meta['types'].append(sdbc_type_code)
-                    self._cached_meta['names'].append(name)
-                    self._cached_meta['precision'].append(metadata.getPrecision(i))
-                    self._cached_meta['scale'].append(metadata.getScale(i))
+                    self._type_codes.append(sdbc_type_code)
+                    self._col_names.append(name)
+                    self._precisions.append(metadata.getPrecision(i))
+                    self._scales.append(metadata.getScale(i))
                     
                     # Map SDBC type to DB-API type
                     dbapi_type = _SDBC_TYPE_MAP.get(sdbc_type_code, STRING)  # Default to STRING if unknown
@@ -1448,9 +1718,107 @@ class Cursor:
                     # Use the mapped DB-API type, not the raw SDBC type code
                     self.description.append((name, dbapi_type, display_size, 
                                            internal_size, precision, scale, null_ok))
+                
+                self._resolve_columns()
+                self._probe_pending = self._has_unprobed_types()
+                
+                if len(self._row_scratch) != column_count:
+                    self._row_scratch = [None] * column_count
             except UnoException as e:
                 raise _map_sdbc_error(e)
                 
+    def _resolve_columns(self):
+        """Rebuild the per-column readers and NULL-check flags from _type_codes."""
+        self._readers = [self._resolve_reader(sdbc_type) for sdbc_type in self._type_codes]
+        self._null_checks = [read is not _read_object and sdbc_type not in _NULL_AWARE_TYPES
+                             for read, sdbc_type in zip(self._readers, self._type_codes)]
+        
+    def _has_unprobed_types(self):
+        """Whether a column of this result has a getObject type not probed yet."""
+        probed = self.connection._object_reads
+        return any(t in _OBJECT_READ_TYPES and t not in probed for t in self._type_codes)
+        
+    def _probe_object_reads(self):
+        """
+        Check on the current row whether getObject returns native values.
+        
+        Each simple-typed column (see _OBJECT_READ_TYPES) whose type code the
+        connection hasn't probed yet is read once with getObject and its
+        Python type compared with the expected one. The outcome is stored
+        per type code on the connection, since a driver may return native
+        strings but stringified numbers. Types confirmed this way take one
+        UNO call per cell instead of a typed getter plus wasNull(); the rest
+        keep their typed getters. NULL cells leave their type open for the
+        next row.
+        """
+        probed = self.connection._object_reads
+        rs = self._resultset
+        for i, sdbc_type in enumerate(self._type_codes, 1):
+            expected = _OBJECT_READ_TYPES.get(sdbc_type)
+            if expected is None or sdbc_type in probed:
+                continue
+            try:
+                value = rs.getObject(i, None)
+            except Exception as e:
+                logger.debug(f"getObject unavailable, using typed getters: {e}")
+                for t in _OBJECT_READ_TYPES:
+                    probed.setdefault(t, False)
+                break
+            if value is None:
+                continue
+            probed[sdbc_type] = type(value) is expected
+            if not probed[sdbc_type]:
+                logger.debug(f"getObject returned {type(value).__name__} for column {i}, "
+                             f"using typed getters for SDBC type {sdbc_type}")
+        self._probe_pending = self._has_unprobed_types()
+        self._resolve_columns()
+            
+    def _resolve_reader(self, sdbc_type):
+        """
+        Return the value reader for an SDBC type code.
+        
+        Args:
+            sdbc_type (int): SDBC DataType constant
+            
+        Returns:
+            callable: Reader taking (resultset, index)
+        """
+        if sdbc_type == _DT_TIMESTAMP:
+            if self.connection._timestamp_native:
+                return self._read_timestamp_native
+            return _read_timestamp_text
+        if sdbc_type == _DT_BIGINT and not hasattr(self._resultset, 'getLong'):
+            return _read_bigint_text
+        if self.connection._object_reads.get(sdbc_type):
+            return _read_object
+        return _VALUE_READERS.get(sdbc_type, _read_string)
+        
+    def _read_timestamp_native(self, rs, index):
+        """
+        Read a TIMESTAMP column via getTimestamp.
+        
+        On the first failure the connection is flagged as not supporting
+        timestamp structures and the current result set switches its
+        TIMESTAMP readers to string parsing, so later cells never pay for
+        the exception again.
+        """
+        if not self.connection._timestamp_native:
+            # A reader list captured before the switch may still call us
+            return _read_timestamp_text(rs, index)
+        try:
+            return _read_timestamp(rs, index)
+        except UnoException as e:
+            # Only the driver refusing getTimestamp means "unsupported"; any
+            # other error is a real problem with this value and propagates
+            logger.debug(f"getTimestamp unavailable, parsing timestamps as strings: {e}")
+            self.connection._timestamp_native = False
+            if self._readers:
+                readers = self._readers
+                for pos, sdbc_type in enumerate(self._type_codes):
+                    if sdbc_type == _DT_TIMESTAMP:
+                        readers[pos] = _read_timestamp_text
+            return _read_timestamp_text(rs, index)
+            
     def _get_row(self):
         """
         Convert the current row to a tuple of Python values.
@@ -1462,27 +1830,36 @@ class Cursor:
             return None
             
         try:
-            row = []
-            column_count = len(self.description)
-            
-            # Use cached type information for faster lookups
-            cached_types = self._cached_meta['types'] if self._cached_meta else None
-            
-            # If _cached_meta isn't populated, we need to ensure it's created
-            if not cached_types:
+            # If the column cache isn't populated, we need to ensure it's created
+            if not self._readers:
                 # Force update of metadata cache
                 self._update_description()
-                cached_types = self._cached_meta['types']
                 
-            for i in range(1, column_count + 1):
-                # Always use the optimized method with direct SDBC type information
-                sdbc_type = cached_types[i-1]
-                value = self._get_value_by_index_and_type(i, sdbc_type)
-                    
-                if self._resultset.wasNull():
-                    row.append(None)
+            if self._probe_pending:
+                self._probe_object_reads()
+                
+            # Use the column readers resolved once in _update_description
+            readers = self._readers
+            
+            rs = self._resultset
+            null_checks = self._null_checks
+            # Fill the reusable scratch buffer in place; only the returned
+            # tuple is allocated per row
+            row = self._row_scratch
+            for pos, read in enumerate(readers):
+                i = pos + 1
+                try:
+                    value = read(rs, i)
+                except UnoException:
+                    # Fall back to string as a last resort
+                    value = rs.getString(i)
                 else:
-                    row.append(value)
+                    if not null_checks[pos]:
+                        # Reader already mapped NULL to None
+                        row[pos] = value
+                        continue
+                    
+                row[pos] = None if rs.wasNull() else value
                     
             return tuple(row)
         except UnoException as e:
@@ -1508,97 +1885,33 @@ class Cursor:
         Performance Notes:
             - Significantly faster than _get_value_by_type for large result sets
             - Avoids repeated metadata lookups by using cached type information
-            - Uses direct type-specific getters when possible
+            - Dispatches through the _VALUE_READERS table in a single dict lookup
+            - _get_row uses per-column readers resolved in _update_description,
+              so this method is only the cold path for ad-hoc lookups
             - Falls back to string conversion for problematic cases
             
         Type Conversions:
             - VARCHAR/CHAR/LONGVARCHAR → str (getString)
             - INTEGER/SMALLINT/TINYINT → int (getInt)
-            - BIGINT → int (using string conversion to avoid overflow)
+            - BIGINT → int (getLong, string conversion if unavailable)
             - DOUBLE/FLOAT/REAL → float (getDouble)
             - BOOLEAN → bool (getBoolean)
             - DATE → datetime.date (using SDBC Date structure)
             - TIME → datetime.time (using SDBC Time structure)
             - TIMESTAMP → datetime.datetime (using SDBC Timestamp structure or string parsing)
             - NUMERIC/DECIMAL → decimal.Decimal or float (string conversion for precision)
-            - BINARY/BLOB → bytes (using UNO ByteSequence)
+            - BINARY/BLOB → bytes (the UNO ByteSequence payload, not copied)
             - Other types → str (fallback to getString)
             
         Notes:
             - NULL values are checked separately after retrieval
             - For timestamp values, direct structure access is attempted first
             - For problematic types, string conversion is used as a fallback
-            - Large integers (BIGINT) use string conversion to avoid overflow
             - Decimal values are converted via string to maintain precision
         """
-        # Fast path for common types
+        read = self._resolve_reader(sdbc_type)
         try:
-            # Handle different SDBC types directly without needing to call getMetaData()
-            if sdbc_type == DataType.VARCHAR or sdbc_type == DataType.CHAR or sdbc_type == DataType.LONGVARCHAR:
-                return self._resultset.getString(index)
-            elif sdbc_type == DataType.INTEGER or sdbc_type == DataType.SMALLINT or sdbc_type == DataType.TINYINT:
-                return self._resultset.getInt(index)
-            elif sdbc_type == DataType.BIGINT:
-                # For very large integers, getString might be safer to avoid overflow
-                big_int_str = self._resultset.getString(index)
-                return int(big_int_str) if big_int_str else 0
-            elif sdbc_type == DataType.DOUBLE or sdbc_type == DataType.FLOAT or sdbc_type == DataType.REAL:
-                return self._resultset.getDouble(index)
-            elif sdbc_type == DataType.BOOLEAN:
-                return self._resultset.getBoolean(index)
-            elif sdbc_type == DataType.DATE:
-                sdbc_date = self._resultset.getDate(index)
-                if self._resultset.wasNull():
-                    return None
-                return Date(sdbc_date.Year, sdbc_date.Month, sdbc_date.Day)
-            elif sdbc_type == DataType.TIME:
-                sdbc_time = self._resultset.getTime(index)
-                if self._resultset.wasNull():
-                    return None
-                return Time(sdbc_time.Hours, sdbc_time.Minutes, sdbc_time.Seconds)
-            elif sdbc_type == DataType.TIMESTAMP:
-                # Try to get timestamp directly first
-                try:
-                    sdbc_timestamp = self._resultset.getTimestamp(index)
-                    if self._resultset.wasNull():
-                        return None
-                    return Timestamp(
-                        sdbc_timestamp.Year,
-                        sdbc_timestamp.Month,
-                        sdbc_timestamp.Day,
-                        sdbc_timestamp.Hours,
-                        sdbc_timestamp.Minutes,
-                        sdbc_timestamp.Seconds
-                    )
-                except:
-                    # Fall back to string parsing
-                    timestamp_str = self._resultset.getString(index)
-                    if not timestamp_str or self._resultset.wasNull():
-                        return None
-                    # Simple parsing for common timestamp format
-                    if ' ' in timestamp_str and ':' in timestamp_str:
-                        date_part, time_part = timestamp_str.split(' ', 1)
-                        year, month, day = map(int, date_part.split('-'))
-                        time_parts = time_part.split(':')
-                        hour = int(time_parts[0])
-                        minute = int(time_parts[1])
-                        second = int(float(time_parts[2])) if len(time_parts) > 2 else 0
-                        return Timestamp(year, month, day, hour, minute, second)
-                    return timestamp_str
-            elif sdbc_type == DataType.NUMERIC or sdbc_type == DataType.DECIMAL:
-                # Get numeric/decimal as string and convert to maintain precision
-                val_str = self._resultset.getString(index)
-                if self._resultset.wasNull():
-                    return None
-                try:
-                    return Decimal(val_str)
-                except (ValueError, InvalidOperation):
-                    return float(val_str) if val_str else 0.0
-            elif sdbc_type == DataType.BINARY or sdbc_type == DataType.VARBINARY or sdbc_type == DataType.LONGVARBINARY or sdbc_type == DataType.BLOB:
-                return bytes(self._resultset.getBytes(index))
-            else:
-                # Fall back to string for types we don't handle specifically
-                return self._resultset.getString(index)
+            return read(self._resultset, index)
         except UnoException as e:
             # Fall back to string as a last resort
             try:
@@ -1624,8 +1937,8 @@ class Cursor:
             - New code should use _get_value_by_index_and_type directly
         """
         # Get SDBC type information from the cached metadata or determine it from the DB-API type
-        if self._cached_meta and 'types' in self._cached_meta and len(self._cached_meta['types']) >= index:
-            return self._get_value_by_index_and_type(index, self._cached_meta['types'][index-1])
+        if index <= len(self._type_codes):
+            return self._get_value_by_index_and_type(index, self._type_codes[index-1])
         
         # If cached metadata doesn't have this column, we need to use the DB-API type
         # to determine the appropriate SDBC type
@@ -1686,33 +1999,12 @@ class Cursor:
             if type_spec is None:
                 # None means no specific type hint, append None to let _infer_parameter_type handle it
                 result.append(None)
-            elif isinstance(type_spec, int) and hasattr(DataType, 'VARCHAR'):
+            elif isinstance(type_spec, int):
                 # It's already a SDBC DataType constant
                 result.append(type_spec)
-            elif type_spec == int or type_spec == NUMBER:
-                result.append(DataType.INTEGER)
-            elif type_spec == float:
-                result.append(DataType.DOUBLE)
-            elif type_spec == str or type_spec == STRING:
-                result.append(DataType.VARCHAR)
-            elif type_spec == bool:
-                result.append(DataType.BOOLEAN)
-            elif type_spec == datetime.date:
-                result.append(DataType.DATE)
-            elif type_spec == datetime.time:
-                result.append(DataType.TIME)
-            elif type_spec == datetime.datetime or type_spec == DATETIME:
-                result.append(DataType.TIMESTAMP)
-            elif type_spec == bytes or type_spec == bytearray or type_spec == BINARY:
-                result.append(DataType.BLOB)
-            elif type_spec == Decimal:
-                result.append(DataType.DECIMAL)
-            elif type_spec == ROWID:
-                # PostgreSQL doesn't have a direct ROWID type, use VARCHAR
-                result.append(DataType.VARCHAR)
             else:
-                # Unknown type, default to VARCHAR
-                result.append(DataType.VARCHAR)
+                # Unknown types default to VARCHAR
+                result.append(_PYTYPE_TO_SDBC.get(type_spec, _DT_VARCHAR))
                 
         return result
 
@@ -1,3 +1,4 @@
+import functools
 import re
 import warnings
 from librepy.pybrex.values import pybrex_logger
@@ -17,6 +18,103 @@ from librepy.peewee.peewee import (
 
 logger = pybrex_logger(__name__)
 
+# Leading keywords of statements that change the schema and therefore
+# invalidate cached catalog metadata
+_DDL_PREFIXES = ('CREATE', 'DROP', 'ALTER', 'TRUNCATE', 'COMMENT')
+
+
+# Keyword arguments consumed by sdbc_dbapi.connect and by peewee's Database
+_SDBC_PARAMS = frozenset(('user', 'password', 'host', 'port', 'dsn', 'connect_timeout'))
+_PEEWEE_PARAMS = frozenset(('thread_safe', 'autorollback', 'field_types',
+                            'operations', 'autocommit', 'autoconnect', 'sequences'))
+
+# Catalog queries used by the metadata methods, kept as module constants so
+# every call passes the same string object to the cursor
+_Q_TABLES = ('SELECT tablename FROM pg_catalog.pg_tables '
+             'WHERE schemaname = ? ORDER BY tablename')
+
+_Q_VIEWS = ('SELECT viewname, definition FROM pg_catalog.pg_views '
+            'WHERE schemaname = ? ORDER BY viewname')
+
+_Q_INDEXES = """
+    SELECT
+        i.relname, idxs.indexdef, idx.indisunique,
+        array_to_string(ARRAY(
+            SELECT pg_get_indexdef(idx.indexrelid, k + 1, TRUE)
+            FROM generate_subscripts(idx.indkey, 1) AS k
+            ORDER BY k), ',')
+    FROM pg_catalog.pg_class AS t
+    INNER JOIN pg_catalog.pg_index AS idx ON t.oid = idx.indrelid
+    INNER JOIN pg_catalog.pg_class AS i ON idx.indexrelid = i.oid
+    INNER JOIN pg_catalog.pg_indexes AS idxs ON
+        (idxs.tablename = t.relname AND idxs.indexname = i.relname)
+    WHERE t.relname = ? AND t.relkind = ? AND idxs.schemaname = ?
+    ORDER BY idx.indisunique DESC, i.relname;"""
+
+_Q_COLUMNS = """
+    SELECT column_name, is_nullable, data_type, column_default
+    FROM information_schema.columns
+    WHERE table_name = ? AND table_schema = ?
+    ORDER BY ordinal_position"""
+
+_Q_PRIMARY_KEYS = """
+    SELECT kc.column_name
+    FROM information_schema.table_constraints AS tc
+    INNER JOIN information_schema.key_column_usage AS kc ON (
+        tc.table_name = kc.table_name AND
+        tc.table_schema = kc.table_schema AND
+        tc.constraint_name = kc.constraint_name)
+    WHERE
+        tc.constraint_type = ? AND
+        tc.table_name = ? AND
+        tc.table_schema = ?"""
+
+_Q_FOREIGN_KEYS = """
+    SELECT DISTINCT
+        kcu.column_name, ccu.table_name, ccu.column_name
+    FROM information_schema.table_constraints AS tc
+    JOIN information_schema.key_column_usage AS kcu
+        ON (tc.constraint_name = kcu.constraint_name AND
+            tc.constraint_schema = kcu.constraint_schema AND
+            tc.table_name = kcu.table_name AND
+            tc.table_schema = kcu.table_schema)
+    JOIN information_schema.constraint_column_usage AS ccu
+        ON (ccu.constraint_name = tc.constraint_name AND
+            ccu.constraint_schema = tc.constraint_schema)
+    WHERE
+        tc.constraint_type = 'FOREIGN KEY' AND
+        tc.table_name = ? AND
+        tc.table_schema = ?"""
+
+_Q_SEQUENCE_EXISTS = """
+    SELECT COUNT(*) FROM pg_class, pg_namespace
+    WHERE relkind='S'
+        AND pg_class.relnamespace = pg_namespace.oid
+        AND relname=?"""
+
+
+def _cached_metadata(method):
+    """
+    Memoize a catalog metadata method on the database instance.
+
+    Results are stored in ``self._meta_cache`` keyed by method name and
+    arguments until the connection is closed, a DDL statement runs, or
+    ``invalidate_metadata_cache()`` is called. List results are returned
+    as shallow copies so callers can't mutate the cached value.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items())))
+        try:
+            result = self._meta_cache[key]
+        except KeyError:
+            result = self._meta_cache[key] = method(self, *args, **kwargs)
+        return list(result) if isinstance(result, list) else result
+    return wrapper
+
+
 class SDBCPostgresqlDatabase(PostgresqlDatabase):
     """
     Peewee Database subclass using the sdbc_dbapi DB-API 2.0 wrapper
@@ -39,17 +137,12 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
                 'Please ensure sdbc_dbapi.py is accessible.'
             )
 
+        self._meta_cache = {}
         self._sdbc_connect_kwargs = kwargs.copy()
 
-        sdbc_params = ['user', 'password', 'host', 'port', 'dsn', 'connect_timeout']
-        peewee_params = ['thread_safe', 'autorollback', 'field_types',
-                         'operations', 'autocommit', 'autoconnect', 'sequences']
         parent_kwargs = {}
-        for key in list(self._sdbc_connect_kwargs.keys()):
-            if key in sdbc_params:
-                pass
-            elif key in peewee_params:
-                parent_kwargs[key] = self._sdbc_connect_kwargs.pop(key)
+        for key in _PEEWEE_PARAMS & self._sdbc_connect_kwargs.keys():
+            parent_kwargs[key] = self._sdbc_connect_kwargs.pop(key)
 
         parent_kwargs['thread_safe'] = False
         Database.__init__(self, database, **parent_kwargs)
@@ -104,9 +197,6 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
         try:
             conn = sdbc_dbapi.connect(**self.connect_params)
             logger.info(f"Successfully connected via sdbc_dbapi")
-            
-            self.transaction_status = conn.get_transaction_status
-            
             return conn
         except sdbc_dbapi.Error as e:
             logger.error(f"SDBC database error during connection: {e}")
@@ -150,7 +240,7 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
             return False
 
         try:
-            status = conn.get_transaction_status()
+            status = self.transaction_status()
         except sdbc_dbapi.Error as e:
             logger.warning(f"Error getting transaction status: {e}")
             self.close()
@@ -180,98 +270,67 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
             warnings.warn(f"Could not retrieve lastval(): {e}")
             return None
 
+    def execute_sql(self, sql, params=None, commit=None):
+        """Execute SQL, dropping cached catalog metadata when it is DDL."""
+        if self._meta_cache and sql.lstrip()[:8].upper().startswith(_DDL_PREFIXES):
+            self.invalidate_metadata_cache()
+        return super(SDBCPostgresqlDatabase, self).execute_sql(sql, params, commit)
+
+    def invalidate_metadata_cache(self):
+        """Discard cached results of the catalog metadata methods."""
+        self._meta_cache.clear()
+
     # Override metadata methods to use '?' placeholders for SDBC
+    # Results are cached per instance, see _cached_metadata
+    @_cached_metadata
     def get_tables(self, schema=None):
-        query = ('SELECT tablename FROM pg_catalog.pg_tables '
-                 'WHERE schemaname = ? ORDER BY tablename')
-        cursor = self.execute_sql(query, (schema or 'public',))
+        cursor = self.execute_sql(_Q_TABLES, (schema or 'public',))
         return [table for table, in cursor.fetchall()]
 
+    @_cached_metadata
+    def get_tables_set(self, schema=None):
+        """Return the table names of a schema as a frozenset for membership tests."""
+        return frozenset(self.get_tables(schema=schema))
+
+    @_cached_metadata
     def get_views(self, schema=None):
-        query = ('SELECT viewname, definition FROM pg_catalog.pg_views '
-                 'WHERE schemaname = ? ORDER BY viewname')
-        cursor = self.execute_sql(query, (schema or 'public',))
+        cursor = self.execute_sql(_Q_VIEWS, (schema or 'public',))
         from librepy.peewee.peewee import ViewMetadata
         return [ViewMetadata(view_name, sql.strip(' \\t;'))
                 for (view_name, sql) in cursor.fetchall()]
 
+    @_cached_metadata
     def get_indexes(self, table, schema=None):
-        query = """
-            SELECT
-                i.relname, idxs.indexdef, idx.indisunique,
-                array_to_string(ARRAY(
-                    SELECT pg_get_indexdef(idx.indexrelid, k + 1, TRUE)
-                    FROM generate_subscripts(idx.indkey, 1) AS k
-                    ORDER BY k), ',')
-            FROM pg_catalog.pg_class AS t
-            INNER JOIN pg_catalog.pg_index AS idx ON t.oid = idx.indrelid
-            INNER JOIN pg_catalog.pg_class AS i ON idx.indexrelid = i.oid
-            INNER JOIN pg_catalog.pg_indexes AS idxs ON
-                (idxs.tablename = t.relname AND idxs.indexname = i.relname)
-            WHERE t.relname = ? AND t.relkind = ? AND idxs.schemaname = ?
-            ORDER BY idx.indisunique DESC, i.relname;"""
-        cursor = self.execute_sql(query, (table, 'r', schema or 'public'))
+        cursor = self.execute_sql(_Q_INDEXES, (table, 'r', schema or 'public'))
         from librepy.peewee.peewee import IndexMetadata
         return [IndexMetadata(name, sql.rstrip(' ;'), columns.split(','),
                               is_unique, table)
                 for name, sql, is_unique, columns in cursor.fetchall()]
 
+    @_cached_metadata
     def get_columns(self, table, schema=None):
-        query = """
-            SELECT column_name, is_nullable, data_type, column_default
-            FROM information_schema.columns
-            WHERE table_name = ? AND table_schema = ?
-            ORDER BY ordinal_position"""
-        cursor = self.execute_sql(query, (table, schema or 'public'))
+        cursor = self.execute_sql(_Q_COLUMNS, (table, schema or 'public'))
         pks = set(self.get_primary_keys(table, schema))
         from librepy.peewee.peewee import ColumnMetadata
         return [ColumnMetadata(name, dt, null == 'YES', name in pks, table, df)
                 for name, null, dt, df in cursor.fetchall()]
 
+    @_cached_metadata
     def get_primary_keys(self, table, schema=None):
-        query = """
-            SELECT kc.column_name
-            FROM information_schema.table_constraints AS tc
-            INNER JOIN information_schema.key_column_usage AS kc ON (
-                tc.table_name = kc.table_name AND
-                tc.table_schema = kc.table_schema AND
-                tc.constraint_name = kc.constraint_name)
-            WHERE
-                tc.constraint_type = ? AND
-                tc.table_name = ? AND
-                tc.table_schema = ?"""
         ctype = 'PRIMARY KEY'
-        cursor = self.execute_sql(query, (ctype, table, schema or 'public'))
+        cursor = self.execute_sql(_Q_PRIMARY_KEYS, (ctype, table, schema or 'public'))
         return [pk for pk, in cursor.fetchall()]
 
+    @_cached_metadata
     def get_foreign_keys(self, table, schema=None):
-        sql = """
-            SELECT DISTINCT
-                kcu.column_name, ccu.table_name, ccu.column_name
-            FROM information_schema.table_constraints AS tc
-            JOIN information_schema.key_column_usage AS kcu
-                ON (tc.constraint_name = kcu.constraint_name AND
-                    tc.constraint_schema = kcu.constraint_schema AND
-                    tc.table_name = kcu.table_name AND
-                    tc.table_schema = kcu.table_schema)
-            JOIN information_schema.constraint_column_usage AS ccu
-                ON (ccu.constraint_name = tc.constraint_name AND
-                    ccu.constraint_schema = tc.constraint_schema)
-            WHERE
-                tc.constraint_type = 'FOREIGN KEY' AND
-                tc.table_name = ? AND
-                tc.table_schema = ?"""
-        cursor = self.execute_sql(sql, (table, schema or 'public'))
+        cursor = self.execute_sql(_Q_FOREIGN_KEYS, (table, schema or 'public'))
         from librepy.peewee.peewee import ForeignKeyMetadata
         return [ForeignKeyMetadata(row[0], row[1], row[2], table)
                 for row in cursor.fetchall()]
 
+    @_cached_metadata
     def sequence_exists(self, sequence):
-        res = self.execute_sql("""
-            SELECT COUNT(*) FROM pg_class, pg_namespace
-            WHERE relkind='S'
-                AND pg_class.relnamespace = pg_namespace.oid
-                AND relname=?""", (sequence,))
+        res = self.execute_sql(_Q_SEQUENCE_EXISTS, (sequence,))
         fetched = res.fetchone()
         return bool(fetched[0]) if fetched else False
 
@@ -283,11 +342,12 @@ class SDBCPostgresqlDatabase(PostgresqlDatabase):
             table_name = model._meta.table_name
             schema = model._meta.schema
         
-        return table_name in self.get_tables(schema=schema)
+        return table_name in self.get_tables_set(schema=schema)
 
     def close(self):
         """Close the database connection."""
         logger.info("Closing SDBCPostgresqlDatabase connection")
+        self.invalidate_metadata_cache()
         super(SDBCPostgresqlDatabase, self).close()
 
     def is_closed(self):
@@ -6,11 +6,11 @@
 
 from librepy.pybrex.msgbox import msgbox
 from librepy.pybrex.values import PYBREX_NAME, PYBREX_VERSION
-        
+
+_ABOUT_MSG = '%s %s' \
+    '\n\nLibreoffice/python' \
+    "\ndeveloper gui." \
+    '\n\n(c) 2019-2024 by Timothy Hoover' % (PYBREX_NAME, PYBREX_VERSION)
+
 def show_about():
-    msg = '%s %s' \
-        '\n\nLibreoffice/python' \
-         "\ndeveloper gui." \
-         '\n\n(c) 2019-2024 by Timothy Hoover' % (PYBREX_NAME, PYBREX_VERSION)
-         
-    msgbox(msg)
+    msgbox(_ABOUT_MSG)
@@ -3,10 +3,14 @@
 # Purpose: Base frame for creating LibreOffice window applications
 # Created: 01.07.2025
 
+import os
+import json
 import uno
 import unohelper
 import traceback
-from random import randint
+import itertools
+import threading
+import time
 
 from com.sun.star.awt import XActionListener, XItemListener, XKeyListener, \
     XMouseListener, XMouseMotionListener, XMenuListener, XWindowListener
@@ -21,9 +25,38 @@ from com.sun.star.awt.WindowClass import SIMPLE, CONTAINER, TOP, MODALTOP
 from com.sun.star.awt.VclWindowPeerAttribute import CLIPCHILDREN, HSCROLL, VSCROLL, AUTOVSCROLL
 from com.sun.star.awt.WindowAttribute import BORDER, SHOW
 
+from librepy.pybrex.values import CONFIG_DIR
+from librepy.pybrex.frame import call_in_ui_thread
+
 import logging
 logger = logging.getLogger(__name__)
 
+# Geometry of frames with PERSIST_GEOMETRY enabled, keyed by "<frame_name>.geometry"
+GEOMETRY_CACHE_PATH = os.path.join(CONFIG_DIR, 'frame_geometry.json')
+
+def _read_geometry_cache():
+    """Return the saved frame geometries, or an empty dict if unavailable"""
+    try:
+        with open(GEOMETRY_CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        logger.error(traceback.format_exc())
+        return {}
+
+def _write_geometry_cache(cache):
+    """Write the frame geometries atomically (temp file + os.replace)"""
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+    tmp_path = GEOMETRY_CACHE_PATH + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, GEOMETRY_CACHE_PATH)
+
+# Process-wide source of frame name suffixes. next() on a count is atomic
+# under the GIL, so no lock is needed.
+_frame_counter = itertools.count(1)
+
 class BaseFrame:
     """
     Base class for creating LibreOffice window frames.
@@ -70,14 +103,43 @@ class BaseFrame:
     """
     
     DEFAULT_MENUBAR_HEIGHT = 25  # Default value
+    # Seconds to wait for resize events to settle before calling
+    # window_resizing. Set to 0 in a subclass to get every resize event.
+    RESIZE_DEBOUNCE = 0.05
+    # Set to True in a subclass to restore the window position and size
+    # from GEOMETRY_CACHE_PATH on creation and save it on dispose
+    PERSIST_GEOMETRY = False
+    # Whether _create_frame must add the new frame to the desktop frames
+    # itself. TaskCreator registers it on current LibreOffice versions; this
+    # is probed on the first frame created and then reused for the process.
+    _needs_append = None
     
-    def __init__(self, parent, ctx, smgr, title="PyBrex Window", frame_name="pybrex_frame", ps=(0, 0, 400, 400), **kwargs):
+    def __init__(self, parent, ctx, smgr, title="PyBrex Window", frame_name="pybrex_frame", ps=None, **kwargs):
         """Initialize a new BaseFrame window."""
         self.parent = parent
         self.ctx = ctx
         self.smgr = smgr
-        
-        # Get position and size from ps tuple
+        # dispose() can be reached both from window_closing and from an
+        # explicit call; only the first one tears the frame down
+        self._disposed = False
+        # Parent hooks are looked up once here instead of with hasattr() on
+        # every event; None when there is no parent or it lacks the method
+        self._parent_save_window_geometry = getattr(parent, 'save_window_geometry', None)
+        self._parent_window_resizing = getattr(parent, 'window_resizing', None)
+        self._parent_window_closing = getattr(parent, 'window_closing', None)
+        self._parent_can_close = getattr(parent, 'can_close', None)
+        # The Desktop is a singleton service; resolve it once per frame
+        self._desktop = smgr.createInstanceWithContext('com.sun.star.frame.Desktop', ctx)
+        
+        # Get position and size from ps tuple; with PERSIST_GEOMETRY a saved
+        # geometry is used when ps isn't given explicitly
+        self._geometry_key = "{}.geometry".format(frame_name)
+        if ps is None:
+            ps = (0, 0, 400, 400)
+            if self.PERSIST_GEOMETRY:
+                saved = _read_geometry_cache().get(self._geometry_key)
+                if saved:
+                    ps = (saved['x'], saved['y'], saved['w'], saved['h'])
         self.posx, self.posy, self.width, self.height = ps
 
         # Get menubar height from kwargs or use default
@@ -106,11 +168,15 @@ class BaseFrame:
         
         # Get window and set properties
         self.window = self.frame.getContainerWindow()
-        desktop = self.smgr.createInstanceWithContext(
-            'com.sun.star.frame.Desktop', self.ctx)
+        desktop = self._desktop
         self.frame.setTitle(title)
         self.frame.setCreator(desktop)
-        desktop.getFrames().append(self.frame)
+        if BaseFrame._needs_append is None:
+            frames = desktop.getFrames()
+            BaseFrame._needs_append = not any(
+                frames.getByIndex(i) == self.frame for i in range(frames.getCount()))
+        if BaseFrame._needs_append:
+            desktop.getFrames().append(self.frame)
         
     def _get_unique_frame_name(self, base_name):
         """Generates a unique frame name to avoid conflicts.
@@ -119,42 +185,24 @@ class BaseFrame:
             base_name (str): Base name for the frame
             
         Returns:
-            str: Unique frame name (e.g., 'myapp_main_1234')
+            str: Unique frame name (e.g., 'myapp_main_3fa000000001')
+        
+        Names come from a monotonic process-wide counter, so no desktop frame
+        scan or retry is needed. The id(self) fragment keeps names distinct
+        even if two copies of this module are loaded.
         """
-        template = "{}_0000".format(base_name)
-        desktop = self.smgr.createInstanceWithContext('com.sun.star.frame.Desktop', self.ctx)
-        frames = desktop.getFrames()
-        existing_names = set()
-        
-        # Collect existing frame names
-        for i in range(frames.getCount()):
-            name = frames.getByIndex(i).getName()
-            if len(name) == len(template) and name.startswith(base_name):
-                existing_names.add(name[-4:])
-        
-        # Generate unique ID (try up to 10 times)
-        for _ in range(10):
-            id_str = "{:04d}".format(randint(1000, 9999))
-            if id_str not in existing_names:
-                return "{}_{}".format(base_name, id_str)
-                
-        # Fallback with timestamp if all attempts fail
-        from time import time
-        return "{}_{:04d}".format(base_name, int(time()*1000)%10000)
+        n = next(_frame_counter)
+        return "{}_{:04x}{:08x}".format(base_name, id(self) & 0xFFFF, n)
         
     def _setup_listeners(self):
         """Sets up basic window listeners"""
-        self.listeners = {}
-        
         # Close listener
-        close_listener = BaseFrameCloseListener(self)
-        self.frame.addCloseListener(close_listener)
-        self.listeners['close'] = close_listener
+        self._close_listener = BaseFrameCloseListener(self)
+        self.frame.addCloseListener(self._close_listener)
         
         # Window listener
-        window_listener = BaseWindowListener(self)
-        self.window.addWindowListener(window_listener)
-        self.listeners['window'] = window_listener
+        self._window_listener = BaseWindowListener(self)
+        self.window.addWindowListener(self._window_listener)
         
     def show(self):
         """Makes the window visible"""
@@ -162,13 +210,23 @@ class BaseFrame:
         
     def dispose(self):
         """Cleans up window resources"""
+        if self._disposed:
+            return
+        self._disposed = True
+        # Removing the window listener means UNO never calls its disposing,
+        # so drop a debounced resize still pending here
+        window_listener = self._window_listener
+        if window_listener._pending_timer is not None:
+            window_listener._pending_timer.cancel()
+            window_listener._pending_timer = None
+        window_listener.parent = None
+        # Remove listeners; a failure on one must not skip the other
         try:
-            # Remove listeners
-            for listener_type, listener in self.listeners.items():
-                if listener_type == 'window':
-                    self.window.removeWindowListener(listener)
-                elif listener_type == 'close':
-                    self.frame.removeCloseListener(listener)  
+            self.window.removeWindowListener(window_listener)
+        except Exception as e:
+            logger.error(traceback.format_exc())
+        try:
+            self.frame.removeCloseListener(self._close_listener)
         except Exception as e:
             logger.error(traceback.format_exc())
 
@@ -214,24 +272,27 @@ class BaseFrame:
                     'x': ps.X,
                     'y': ps.Y
                 }
+        
+        When PERSIST_GEOMETRY is set, the geometry is also written to
+        GEOMETRY_CACHE_PATH and restored the next time the frame is created.
         """
-        if self.parent:
-            if hasattr(self.parent, 'save_window_geometry'):
-                self.parent.save_window_geometry()
-            else:
-                logger.info("Parent has no save_window_geometry method")
-        else:
-            logger.info("Has no parent")
+        if self.PERSIST_GEOMETRY:
+            try:
+                ps = self.window.PosSize
+                cache = _read_geometry_cache()
+                cache[self._geometry_key] = {'x': ps.X, 'y': ps.Y, 'w': ps.Width, 'h': ps.Height}
+                _write_geometry_cache(cache)
+            except Exception:
+                logger.error(traceback.format_exc())
+        fn = self._parent_save_window_geometry
+        if fn is not None:
+            fn()
 
     def window_resizing(self, width, height):
         """Override this method to handle window resize events"""
-        if self.parent:
-            if hasattr(self.parent, 'window_resizing'):
-                self.parent.window_resizing(width, height)
-            else:
-                logger.info("Parent has no window_resizing method")
-        else:
-            logger.info("Has no parent")
+        fn = self._parent_window_resizing
+        if fn is not None:
+            fn(width, height)
 
     def window_closing(self):
         """Called when the window is about to close.
@@ -253,13 +314,9 @@ class BaseFrame:
                 # Call parent to handle disposal
                 super().window_closing()
         """
-        if self.parent:
-            if hasattr(self.parent, 'window_closing'):
-                self.parent.window_closing()
-            else:
-                logger.info("Parent has no window_closing method")
-        else:
-            logger.info("Has no parent")
+        fn = self._parent_window_closing
+        if fn is not None:
+            fn()
         
         self.dispose()
 
@@ -278,16 +335,11 @@ class BaseFrame:
                     return msgbox.show_yes_no("Save changes?") == "yes"
                 return True
         """
-        if self.parent:
-            if hasattr(self.parent, 'can_close'):
-                return self.parent.can_close()
-            else:
-                logger.info("Parent has no can_close method")
-                return True
-        else:
-            logger.info("Has no parent")
-            return True
-          # Default behavior: allow closing
+        fn = self._parent_can_close
+        if fn is not None:
+            return fn()
+        # Default behavior: allow closing
+        return True
 
     def create_child_window(self, wtype, service, attrs, ps):
         """Creates a child window with specified attributes.
@@ -416,11 +468,22 @@ class BaseFrame:
 # Listener classes
 class BaseFrameCloseListener(unohelper.Base, XCloseListener):
     """Window closing"""
+    # Seconds an approval from can_close() covers further queryClosing calls
+    ANSWER_TIMEOUT = 1.0
+    
     def __init__(self, parent):
         self.parent = parent
+        # Time can_close() last approved a close, so the repeated
+        # queryClosing calls of one close sequence don't ask again (and
+        # prompt the user twice). It expires, so a close that another
+        # listener vetoed asks again next time.
+        self._answered = None
     
     def queryClosing(self, event, owner):
         """Window close querying"""
+        if self._answered is not None and time.monotonic() - self._answered < self.ANSWER_TIMEOUT:
+            return
+        self._answered = None
         b_close = True
         try:
             b_close = self.parent.can_close()
@@ -430,8 +493,10 @@ class BaseFrameCloseListener(unohelper.Base, XCloseListener):
         if not b_close:
             logger.debug('Vetoing close')
             raise CloseVetoException() 
+        self._answered = time.monotonic()
         
     def notifyClosing(self, event):
+        self._answered = None
         try:
             # Only call window_closing, it will handle dispose
             self.parent.window_closing()
@@ -440,21 +505,71 @@ class BaseFrameCloseListener(unohelper.Base, XCloseListener):
         
     def disposing(self, event):
         logger.debug('Close disposing')
+        self._answered = None
 
 class BaseWindowListener(unohelper.Base, XWindowListener):
     """Window listener for the BaseFrame class"""
     
     def __init__(self, parent):
         self.parent = parent
+        self._last_wh = (0, 0)
+        self._pending_timer = None
         
     def disposing(self, event):
+        # Deliver a resize still waiting on the debounce timer
+        if self._pending_timer is not None:
+            self._pending_timer.cancel()
+            self._pending_timer = None
+            self._flush_resize()
         self.parent = None
         
     def windowResized(self, ev):
-        """Called when the window is resized"""
+        """Called when the window is resized
+        
+        Events repeating the last size are dropped, and bursts (drag-resize)
+        are coalesced into a single window_resizing call once they have
+        paused for parent.RESIZE_DEBOUNCE seconds.
+        """
         if self.parent:
-            ps = self.parent.window.PosSize
-            self.parent.window_resizing(ps.Width, ps.Height)
+            # A WindowEvent already carries the new size; only ask the
+            # window (another UNO call) when the event doesn't
+            w = getattr(ev, 'Width', None)
+            h = getattr(ev, 'Height', None)
+            if w is None or h is None:
+                ps = self.parent.window.PosSize
+                w, h = ps.Width, ps.Height
+            wh = (w, h)
+            if wh == self._last_wh:
+                return
+            self._last_wh = wh
+            
+            delay = self.parent.RESIZE_DEBOUNCE
+            if not delay:
+                self.parent.window_resizing(*wh)
+                return
+            
+            if self._pending_timer is not None:
+                self._pending_timer.cancel()
+            self._pending_timer = threading.Timer(delay, self._on_timer)
+            self._pending_timer.daemon = True
+            self._pending_timer.start()
+            
+    def _on_timer(self):
+        """Debounce timer expired; resize on the UI thread, not this one"""
+        self._pending_timer = None
+        parent = self.parent
+        if parent:
+            call_in_ui_thread(parent.ctx, parent.smgr, self._flush_resize)
+            
+    def _flush_resize(self):
+        """Forward the last seen size to the parent frame"""
+        parent = self.parent
+        # A callback queued before dispose may still arrive
+        if parent and not parent._disposed:
+            try:
+                parent.window_resizing(*self._last_wh)
+            except Exception:
+                logger.error(traceback.format_exc())
             
     def windowMoved(self, event):
         pass
@@ -8,6 +8,7 @@
 
 import unohelper
 import traceback
+from collections import Counter
 
 from librepy.pybrex.msgbox import msgbox
 
@@ -25,77 +26,73 @@ class ComboData( unohelper.Base, XTextListener ):
         ctr.addKeyListener(self.KeyListener(self))
         self.selection = None
         self.prvs = ''
+        #Item list currently shown, so init_data can skip an identical reload
+        self._last_items = None
+        #Set while we change the text ourselves so textChanged ignores it
+        self._suppress = False
         
     def init_data(self, data):
         ctr = self.ctr
         self.config_data(data)
+        items = tuple(self.names)
+        if items == self._last_items:
+            return
         #Set data to combo box
         ctr.removeItems(0, ctr.getItemCount())
-        ctr.addItems(tuple(self.names), 0)
+        ctr.addItems(items, 0)
+        self._last_items = items
         
     def config_data(self, data):
         #Rename duplicate names
+        #names keeps display order for addItems; name_dict is used for lookups
         names, ids = [], []
         name_dict = {}
         self.names, self.ids = names, ids
         self.name_dict = name_dict
         
-        #No renaming necessary if 1 or less items
-        if len(data) < 2:
-            if len(data) == 1:
-                names.append(data[0]['name'])
-                ids.append(data[0]['id'])
-                name_dict[names[0]] = ids[0]
-            return
-            
-        n = 1
-        s = data[0]['name']
-        new_name = s
-        if s == data[1]['name']:
-            new_name = '%s (%s)' % (s, n)
-            n += 1
-        names.append(new_name)
-        ids.append(data[0]['id'])
-        name_dict[new_name] = data[0]['id']
-        
-        for i in range(1, len(data)):
-            if data[i]['name'] == s:
-                new_name = '%s (%s)' % (s, n)
-                n += 1
-            else:
-                n = 1
-                s = data[i]['name']
-                new_name = s
-            names.append(new_name)
-            ids.append(data[i]['id'])
-            name_dict[new_name]  = data[i]['id']
-        return
+        #Duplicates are numbered 'name (1)', 'name (2)', ...; unique names stay as-is
+        totals = Counter(row['name'] for row in data)
+        seen = {}
+        for row in data:
+            name = row['name']
+            rid = row['id']
+            if totals[name] > 1:
+                n = seen.get(name, 0) + 1
+                seen[name] = n
+                name = '%s (%s)' % (name, n)
+            names.append(name)
+            ids.append(rid)
+            name_dict[name] = rid
         
     def get_id(self):
         t = self.ctr.getText()
-        return self.name_dict[t] if t in self.names else None
+        return self.name_dict.get(t)
         
     def key_pressed(self, ev):
         if ev.KeyCode == 1283:
-            self.ctr.removeTextListener(self.listener)
-            self.ctr.setText('')
-            self.prvs = ''
-            self.ctr.addTextListener(self.listener)
+            self._suppress = True
+            try:
+                self.ctr.setText('')
+                self.prvs = ''
+            finally:
+                self._suppress = False
         
     def text_changed(self, ev):
         t = self.ctr.getText()
         if t == '':
             self.prvs = ''
             return
-        self.ctr.removeTextListener(self.listener)
-        if t in self.names:
-            self.prvs = t
-            self.selection = self.ctr.getSelection()
-        else:
-            self.ctr.setText(self.prvs)
-            if self.selection:
-                self.ctr.setSelection(self.selection)
-        self.ctr.addTextListener(self.listener)
+        self._suppress = True
+        try:
+            if t in self.name_dict:
+                self.prvs = t
+                self.selection = self.ctr.getSelection()
+            else:
+                self.ctr.setText(self.prvs)
+                if self.selection:
+                    self.ctr.setSelection(self.selection)
+        finally:
+            self._suppress = False
         
     class TextListener(unohelper.Base, XTextListener):
         
@@ -104,6 +101,8 @@ class ComboData( unohelper.Base, XTextListener ):
         def disposing(self, ev):
             pass
         def textChanged(self, ev):
+            if self.parent._suppress:
+                return
             try:
                 self.parent.text_changed(ev)
             except Exception as e:
@@ -11,8 +11,6 @@ import uno
 import unohelper
 import traceback
 
-from librepy.pybrex.msgbox import msgbox
-from librepy.pybrex.grid import GridBase
 from librepy.pybrex.listeners import Listeners
 from librepy.pybrex.uno_date_time_converters import (
     uno_time_to_python,
@@ -25,12 +23,120 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _effective_str(ctr):
+    v = ctr.Model.EffectiveValue
+    return "" if v is None else str(v)
+
+def _effective_int(ctr):
+    v = ctr.Model.EffectiveValue
+    return 0 if v is None else int(v)
+
+def _effective_float(ctr):
+    v = ctr.Model.EffectiveValue
+    return 0.0 if v is None else float(v)
+
+def _set_effective(ctr, value):
+    ctr.Model.EffectiveValue = value
+
+#Per data type handlers used by get_values, set_values and clear_values
+_GET_HANDLERS = {
+    'str': lambda c: c.getText(),
+    'int': lambda c: int(c.getValue()),
+    'long': lambda c: int(c.getValue()),
+    'double': lambda c: float(c.getValue()),
+    'float': lambda c: float(c.getValue()),
+    'e_str': _effective_str,
+    'e_int': _effective_int,
+    'e_long': _effective_int,
+    'e_double': _effective_float,
+    'e_float': _effective_float,
+    'time': lambda c: uno_time_to_python(c.getTime()),
+    'date': lambda c: uno_date_to_python(c.getDate()),
+    'check': lambda c: bool(c.getState()),
+    'option': lambda c: c.getState(),
+    'int_check': lambda c: c.getState(),
+    'item': lambda c: c.getSelectedItem(),
+}
+
+_SET_HANDLERS = {
+    'str': lambda c, v: c.setText(v),
+    'int': lambda c, v: c.setValue(v),
+    'long': lambda c, v: c.setValue(v),
+    'double': lambda c, v: c.setValue(v),
+    'float': lambda c, v: c.setValue(v),
+    'e_str': _set_effective,
+    'e_int': _set_effective,
+    'e_long': _set_effective,
+    'e_double': _set_effective,
+    'e_float': _set_effective,
+    'time': lambda c, v: c.setTime(python_time_to_uno(v)),
+    'date': lambda c, v: c.setDate(python_date_to_uno(v)),
+    'check': lambda c, v: c.setState(int(v)),
+    'option': lambda c, v: c.setState(v),
+    'int_check': lambda c, v: c.setState(v),
+    'item': lambda c, v: c.selectItem(v, True),
+}
+
+_CLEAR_HANDLERS = {
+    'str': lambda c: c.setText(''),
+    'int': lambda c: c.setValue(0),
+    'long': lambda c: c.setValue(0),
+    'double': lambda c: c.setValue(0),
+    'float': lambda c: c.setValue(0),
+    'e_str': lambda c: _set_effective(c, 0),
+    'e_int': lambda c: _set_effective(c, 0),
+    'e_long': lambda c: _set_effective(c, 0),
+    'e_double': lambda c: _set_effective(c, 0),
+    'e_float': lambda c: _set_effective(c, 0),
+    'time': lambda c: c.setEmpty(),
+    'date': lambda c: c.setEmpty(),
+    'check': lambda c: c.setState(0),
+    'int_check': lambda c: c.setState(0),
+    'option': lambda c: c.setState(False),
+}
+
+#Geometry and name set on every control model, already in sorted order
+_BASE_PROP_NAMES = ("Height", "Name", "PositionX", "PositionY", "Width")
+
+#Fixed button properties used by add_ok and add_cancel
+_OK_PROPS = {'DefaultButton': True, 'Label': 'OK', 'PushButtonType': 1}
+_CANCEL_PROPS = {'Label': 'Cancel', 'PushButtonType': 2}
+
+def _make_adder(s_type, data_type=None, listener=None):
+    '''Build an add_* method for a control that only needs creating.
+    
+    data_type is the default recorded for get_values/set_values; listener
+    names the Listeners method that attaches the optional callback.
+    '''
+    if listener is not None:
+        def adder(self, name, x, y, width, height, callback = None, data_type = data_type, **props):
+            ctr = self._add_typed(s_type, name, x, y, width, height, data_type, props)
+            if callback is not None:
+                getattr(self, listener)(ctr, callback)
+            return ctr
+    elif data_type is not None:
+        def adder(self, name, x, y, width, height, data_type = data_type, **props):
+            return self._add_typed(s_type, name, x, y, width, height, data_type, props)
+    else:
+        def adder(self, name, x, y, width, height, **props):
+            return self._add_typed(s_type, name, x, y, width, height, None, props)
+    return adder
+
+
 class Controls(Listeners):
+    #Number format state shared by set_format
+    _format_supplier = None
+    _format_locale = None
+    _format_keys = {}
+    
     def __init__(self, ctx=None, smgr=None):
         self._controls = {}
         self._pages = {}
         self._data_types = {}
         self._values = DataRow()
+        #(key, ctr, get, clear) for every typed control; rebuilt lazily after
+        #a typed control is added
+        self._value_plan = None
         self.format = '0 ##/##'
         self.ctx = ctx
         self.smgr = smgr
@@ -38,102 +144,55 @@ class Controls(Listeners):
         
     def get_ctr_str_value(self, ctr):
         'Get effective value from control'
-        v = ctr.Model.EffectiveValue
-        if v is None:
-            return ""
-        else:
-            return str(v)
+        return _effective_str(ctr)
         
     def get_ctr_int_value(self, ctr):
         'Get effective value from control'
-        v = ctr.Model.EffectiveValue
-        if v is None:
-            return 0
-        else:
-            return int(v)
-        get_ctr_float_val
+        return _effective_int(ctr)
+        
     def get_ctr_float_value(self, ctr):
         'Get effective value from control'
-        v = ctr.Model.EffectiveValue
-        if v is None:
-            return 0.0
-        else:
-            return float(v)
+        return _effective_float(ctr)
             
     def set_ctr_value(self, ctr, value):
-        ctr.Model.EffectiveValue = value
+        _set_effective(ctr, value)
     
-    def get_values(self):
+    def _build_plan(self):
+        data_types = self._data_types
+        plan = []
         for key, ctr in self._controls.items():
-            if key in self._data_types and key in self._values:
-                dt = self._data_types[key]
-                if dt == 'str':
-                    self._values[key] = ctr.getText()
-                elif dt in ('int', 'long'):
-                    self._values[key] = int(ctr.getValue())
-                elif dt in ( 'double', 'float'):
-                    self._values[key] = float(ctr.getValue())
-                elif dt == 'e_str':
-                    self._values[key] = self.get_ctr_str_value(ctr)
-                elif dt in ('e_int', 'e_long'):
-                    self._values[key] = self.get_ctr_int_value(ctr)
-                elif dt in ('e_double', 'e_float'):
-                    self._values[key] = self.get_ctr_float_value(ctr)
-                elif dt == 'time':
-                    self._values[key] = uno_time_to_python(ctr.getTime())
-                elif dt == 'date':
-                    self._values[key] = uno_date_to_python(ctr.getDate())
-                elif dt == 'check':
-                    self._values[key] = bool(ctr.getState())
-                elif dt == 'option' or dt == 'int_check':
-                    self._values[key] = ctr.getState()
-                elif dt == 'item':
-                    self._values[key] = ctr.getSelectedItem()
-        return self._values
+            dt = data_types.get(key)
+            if dt:
+                plan.append((key, ctr, _GET_HANDLERS.get(dt), _CLEAR_HANDLERS.get(dt)))
+        self._value_plan = plan
+        return plan
+    
+    def get_values(self):
+        plan = self._value_plan
+        if plan is None:
+            plan = self._build_plan()
+        values = self._values
+        for key, ctr, get, _ in plan:
+            if get is not None and key in values:
+                values[key] = get(ctr)
+        return values
                     
     def set_values(self, values):
-        
+        controls = self._controls
+        data_types = self._data_types
         for key, value in values.items():
-            if key in self._controls and key in self._data_types:
-                ctr = self._controls[key]
-                dt = self._data_types[key]
-                if dt == 'str':
-                    ctr.setText(value)
-                elif dt in ('long', 'int', 'double', 'float'):
-                    ctr.setValue(value)
-                elif dt in ('e_str', 'e_long', 'e_float', 'e_int', 'e_double'):
-                    ctr.Model.EffectiveValue = value
-                elif dt == 'time':
-                    ctr.setTime(python_time_to_uno(value))
-                elif dt == 'date':
-                    ctr.setDate(python_date_to_uno(value))
-                elif dt == 'check':
-                    ctr.setState(int(value))
-                elif dt == 'option' or dt == 'int_check':
-                    ctr.setState(value)
-                elif dt == 'item':
-                    ctr.selectItem(value, True)
+            ctr = controls.get(key)
+            h = _SET_HANDLERS.get(data_types.get(key))
+            if ctr is not None and h is not None:
+                h(ctr, value)
                     
     def clear_values(self):
-        for key, ctr in self._controls.items():
-            if key in self._data_types:
-                dt = self._data_types[key]
-                if dt == 'str':
-                    ctr.setText('')
-                elif dt in ('int', 'long', 'double', 'float'):
-                    ctr.setValue(0)
-                elif dt in ('e_str', 'e_long', 'e_float', 'e_int', 'e_double'):
-                    ctr.Model.EffectiveValue = 0
-                elif dt == 'time':
-                    ctr.setEmpty()
-                elif dt == 'date':
-                    ctr.setEmpty()
-                elif dt == 'check' or dt == 'int_check':
-                    ctr.setState(0)
-                elif dt == 'option':
-                    ctr.setState(False)
-                #elif dt == 'item':
-                    #ctr.selectItem(value, True)
+        plan = self._value_plan
+        if plan is None:
+            plan = self._build_plan()
+        for _, ctr, _, clear in plan:
+            if clear is not None:
+                clear(ctr)
     
     def add_control(self, s_type, name, x, y, width, height, page = None, **props):
         '''Add a control to the dialog'''
@@ -145,12 +204,15 @@ class Controls(Listeners):
             model = self._dialog_model
         #create the control
         ctr_mod = model.createInstance(s_type)
-        #set the controls properties
-        ctr_mod.setPropertyValues(
-                ("Height", "PositionX", "PositionY", "Width", "Name" ),
-                (height, x, y, width, name))
-        if len(props) > 0:
-            ctr_mod.setPropertyValues(tuple(props.keys()), tuple(props.values()))
+        #set the controls properties in a single call. setPropertyValues
+        #expects the names sorted; out of order names are silently skipped
+        if props:
+            values = {"Height": height, "PositionX": x, "PositionY": y, "Width": width, "Name": name}
+            values.update(props)
+            names = tuple(sorted(values))
+            ctr_mod.setPropertyValues(names, tuple(map(values.__getitem__, names)))
+        else:
+            ctr_mod.setPropertyValues(_BASE_PROP_NAMES, (height, name, x, y, width))
         #insert the control
         model.insertByName(name, ctr_mod)
         return dlg.getControl(name)
@@ -163,135 +225,60 @@ class Controls(Listeners):
         return ctr
         
     def add_ok(self, name, x, y, width, height, **props):
-        return self.add_button(name, x, y, width, height, 
-            DefaultButton = True, Label = 'OK', PushButtonType = 1, **props)
+        return self.add_button(name, x, y, width, height, **_OK_PROPS, **props)
             
     def add_cancel(self, name, x, y, width, height, **props):
-        self._controls[name] = self.add_button(name, x, y, width, height,
-            Label = 'Cancel', PushButtonType = 2, **props)
-        return self._controls[name]
+        return self.add_button(name, x, y, width, height, **_CANCEL_PROPS, **props)
             
     def add_ok_cancel(self, px = None):
         width, height = self.POS_SIZE[2], self.POS_SIZE[3]
         if px is None: px = width - 90
         b1 = self.add_ok('OkayButton', px, height - 20, 40, 15)
         b2 = self.add_cancel('CancelButton', px + 43, height - 20, 40, 15)
-        self._controls['OkayButton'] = b1
-        self._controls['CancelButton'] = b2
         return b1, b2
             
     def add_done(self, px = None):
         width, height = self.POS_SIZE[2], self.POS_SIZE[3]
         if px is None: px = width - 60
-        b1 = self.add_button('DoneButton', px, height - 20, 50, 15, Label = "Done", PushButtonType = 2)
-        self._controls['DoneButton'] = b1
-        return b1
-        
-    def add_label(self, name, x, y, width, height, **props):
-        self._controls[name] = self.add_control("com.sun.star.awt.UnoControlFixedTextModel", name, x, y, width, height, **props)
-        return self._controls[name]
+        return self.add_button('DoneButton', px, height - 20, 50, 15, Label = "Done", PushButtonType = 2)
         
-    def add_check(self, name, x, y, width, height, callback = None, data_type = 'check', **props):
+    def _add_typed(self, s_type, name, x, y, width, height, data_type, props):
         if data_type:
             self._data_types[name] = data_type
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlCheckBoxModel", name, x, y, width, height, **props)
-        if callback is not None:
-            self.add_item_listener(self._controls[name], callback)
-        return self._controls[name]
+            self._value_plan = None
+        ctr = self._controls[name] = self.add_control(s_type, name, x, y, width, height, **props)
+        return ctr
+    
+    add_label = _make_adder("com.sun.star.awt.UnoControlFixedTextModel")
+    add_check = _make_adder("com.sun.star.awt.UnoControlCheckBoxModel", 'check', 'add_item_listener')
     add_checkbox = add_check
-        
-    def add_list(self, name, x, y, width, height, data_type = 'list', **props):
-        if data_type:
-            self._data_types[name] = data_type
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlListBoxModel", name, x, y, width, height, **props)
-        return self._controls[name]
+    add_list = _make_adder("com.sun.star.awt.UnoControlListBoxModel", 'list')
     add_listbox = add_list
-            
-    def add_combo(self, name, x, y, width, height, data_type = 'str', **props):
-        if data_type:
-            self._data_types[name] = data_type
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlComboBoxModel", name, x, y, width, height, **props)
-        return self._controls[name]
+    add_combo = _make_adder("com.sun.star.awt.UnoControlComboBoxModel", 'str')
     add_combobox = add_combo
-    
-    def add_radio(self, name, x, y, width, height, callback = None, data_type = 'option', **props):
-        if data_type:
-            self._data_types[name] = data_type
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlRadioButtonModel", name, x, y, width, height, **props)
-        if callback is not None:
-            self.add_item_listener(self._controls[name], callback)
-        return self._controls[name]
+    add_radio = _make_adder("com.sun.star.awt.UnoControlRadioButtonModel", 'option', 'add_item_listener')
     add_option = add_radio
-            
-    def add_line(self, name, x, y, width, height, **props):
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlFixedLineModel", name, x, y, width, height, **props)
-        return self._controls[name]
-            
-    def add_numeric(self, name, x, y, width, height, data_type = 'float', **props):
-        if data_type:
-            self._data_types[name] = data_type
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlNumericFieldModel", name, x, y, width, height, **props)
-        return self._controls[name]
-            
-    def add_edit(self, name, x, y, width, height, data_type = 'str', **props):
-        if data_type:
-            self._data_types[name] = data_type
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlEditModel", name, x, y, width, height, **props)
-        return self._controls[name]
-            
-    def add_date(self, name, x, y, width, height, data_type = 'date', **props):
-        if data_type:
-            self._data_types[name] = data_type
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlDateFieldModel", name, x, y, width, height, **props)
-        return self._controls[name]
+    add_line = _make_adder("com.sun.star.awt.UnoControlFixedLineModel")
+    add_numeric = _make_adder("com.sun.star.awt.UnoControlNumericFieldModel", 'float')
+    add_edit = _make_adder("com.sun.star.awt.UnoControlEditModel", 'str')
+    add_date = _make_adder("com.sun.star.awt.UnoControlDateFieldModel", 'date')
+    add_time = _make_adder("com.sun.star.awt.UnoControlTimeFieldModel", 'time')
+    add_currency = _make_adder("com.sun.star.awt.UnoControlCurrencyFieldModel", 'float')
+    add_scrollbar = _make_adder("com.sun.star.awt.UnoControlScrollBarModel")
+    add_progressbar = _make_adder("com.sun.star.awt.UnoControlProgressBarModel")
+    add_image = _make_adder("com.sun.star.awt.UnoControlImageControlModel")
+    add_groupbox = _make_adder("com.sun.star.awt.UnoControlGroupBoxModel")
+    add_tree = _make_adder("com.sun.star.awt.tree.TreeControlModel")
+    add_page_container = _make_adder("com.sun.star.awt.UnoMultiPageModel")
             
     def add_format(self, name, x, y, width, height, format = None, data_type = 'e_float', **props):
-        if data_type:
-            self._data_types[name] = data_type
-        ctr = self.add_control("com.sun.star.awt.UnoControlFormattedFieldModel", name, x, y, width, height, **props)
+        ctr = self._add_typed("com.sun.star.awt.UnoControlFormattedFieldModel", name, x, y, width, height, data_type, props)
         if format:
             self.set_format(ctr.Model, format)
         elif self.format:
             self.set_format(ctr.Model, self.format)
-        self._controls[name] = ctr
         return ctr
             
-    def add_time(self, name, x, y, width, height, data_type = 'time', **props):
-        if data_type:
-            self._data_types[name] = data_type
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlTimeFieldModel", name, x, y, width, height, **props)
-        return self._controls[name]
-            
-    def add_currency(self, name, x, y, width, height, data_type = 'float', **props):
-        if data_type:
-            self._data_types[name] = data_type
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlCurrencyFieldModel", name, x, y, width, height, **props)
-        return self._controls[name]
-            
-    def add_scrollbar(self, name, x, y, width, height, **props):
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlScrollBarModel", name, x, y, width, height, **props)
-        return self._controls[name]
-            
-    def add_progressbar(self, name, x, y, width, height, **props):
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlProgressBarModel", name, x, y, width, height, **props)
-        return self._controls[name]
-            
-    def add_image(self, name, x, y, width, height, **props):
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlImageControlModel", name, x, y, width, height, **props)
-        return self._controls[name]
-            
-    def add_groupbox(self, name, x, y, width, height, **props):
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoControlGroupBoxModel", name, x, y, width, height, **props)
-        return self._controls[name]
-            
-    def add_tree(self, name, x, y, width, height, **props):
-        self._controls[name] =  self.add_control("com.sun.star.awt.tree.TreeControlModel", name, x, y, width, height, **props)
-        return self._controls[name]
-            
-    def add_page_container(self, name, x, y, width, height, **props):
-        self._controls[name] =  self.add_control("com.sun.star.awt.UnoMultiPageModel", name, x, y, width, height, **props)
-        return self._controls[name]
-            
     def add_grid(self, name, x, y, width, height, titles, page = None, **props):
         if not self.ctx:
             raise RuntimeError("Context not set. Set provide ctx in constructor")
@@ -299,6 +286,8 @@ class Controls(Listeners):
         if not self.smgr:
             self.smgr = self.ctx.ServiceManager
             
+        #Imported here so dialogs without a grid don't load the grid module
+        from librepy.pybrex.grid import GridBase
         g_base = GridBase(self.ctx, self.smgr)
         
         grid_ctr, grid_model = g_base.create_grid_dialog(name, x, y, width, height, titles, self._dialog, self._dialog_model, page, **props)
@@ -320,21 +309,27 @@ class Controls(Listeners):
         return page   
 
     def set_format(self, Control,  sFormat):
-        #get the locale
-        oLocale = uno.createUnoStruct("com.sun.star.lang.Locale")
-        #get the format supplier
-        oSupplier = self.create_service("com.sun.star.util.NumberFormatsSupplier")
+        #The supplier, locale and format keys are shared by every formatted
+        #field, so they are created and looked up once per process
+        oLocale = Controls._format_locale
+        if oLocale is None:
+            oLocale = Controls._format_locale = uno.createUnoStruct("com.sun.star.lang.Locale")
+        oSupplier = Controls._format_supplier
+        if oSupplier is None:
+            oSupplier = Controls._format_supplier = self.create_service("com.sun.star.util.NumberFormatsSupplier")
         Control.FormatsSupplier = oSupplier
-        oSupplier = Control.FormatsSupplier
-        oFormats = oSupplier.getNumberFormats()
-        #See if the number format exists by obtaining the key.
-        nKey = oFormats.queryKey(sFormat, oLocale, True)
-        # If the number format does not exist, add it.
-        if (nKey == -1) :
-            nKey = oFormats.addNew(sFormat, oLocale)
-            # If it failed to add, and it should not fail to add, then use zero.
+        nKey = Controls._format_keys.get(sFormat)
+        if nKey is None:
+            oFormats = oSupplier.getNumberFormats()
+            #See if the number format exists by obtaining the key.
+            nKey = oFormats.queryKey(sFormat, oLocale, True)
+            # If the number format does not exist, add it.
             if (nKey == -1) :
-                nKey = 0
+                nKey = oFormats.addNew(sFormat, oLocale)
+                # If it failed to add, and it should not fail to add, then use zero.
+                if (nKey == -1) :
+                    nKey = 0
+            Controls._format_keys[sFormat] = nKey
         #Now, set the key for the desired formatting.
         Control.FormatKey = nKey
     
@@ -346,12 +341,12 @@ class Controls(Listeners):
 
 
 class DataRow(dict):
+    '''dict whose keys can also be read and written as attributes'''
+    __setattr__ = dict.__setitem__
+    __delattr__ = dict.__delitem__
         
     def __getattr__(self, name):
-        return super().__getitem__(name)
-        
-    def __setattr__(self, name, value):
-        super().__setitem__(name)
-        
-    def __delattr__(self, name):
-        super().__delitem__(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
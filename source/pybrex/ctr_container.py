@@ -9,10 +9,6 @@ import uno, unohelper
 import traceback
 
 from librepy.pybrex.controls import Controls
-from librepy.pybrex.grid import GridBase
-
-from librepy.pybrex.msgbox import msgbox
-from librepy.pybrex.my_mri import mri
 
 from com.sun.star.awt.PosSize import POSSIZE, SIZE
 from com.sun.star.awt import XAdjustmentListener, XTextListener, XMouseListener, XFocusListener, XKeyListener
@@ -78,7 +74,7 @@ class Container(Controls):
         ctr_mod = smgr.createInstanceWithContext(s_type, ctx)
         #set the controls properties
         if len(props) > 0:
-            ctr_mod.setPropertyValues(tuple(props.keys()), tuple(props.values()))
+            ctr_mod.setPropertyValues((*props,), (*props.values(),))
         ctr.setPosSize(x, y, width, height, POSSIZE)
         #insert the control
         ctr.setModel(ctr_mod)
@@ -88,6 +84,7 @@ class Container(Controls):
     def add_grid(self, name, x, y, width, height, titles, **props):
         ''' Override the default add_grid function '''
 
+        from librepy.pybrex.grid import GridBase
         g_base = GridBase(self.ctx, self.smgr)
 
         g_base.titles = titles
@@ -104,7 +101,7 @@ def create_control(ctx, smgr, ctrType, px, py, width, height, **props):
     '''Create a control for the container'''
     ctr = smgr.createInstanceWithContext('com.sun.star.awt.UnoControl%s' % ctrType, ctx)
     ctr_mod = smgr.createInstanceWithContext('com.sun.star.awt.UnoControl%sModel' % ctrType, ctx)
-    ctr_mod.setPropertyValues(tuple(props.keys()), tuple(props.values()))
+    ctr_mod.setPropertyValues((*props,), (*props.values(),))
     ctr.setModel(ctr_mod)
     ctr.setPosSize(px, py, width, height, POSSIZE)
     return ctr
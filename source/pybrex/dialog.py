@@ -6,6 +6,7 @@
 
 
 
+import time
 import uno
 import unohelper
 import traceback
@@ -21,6 +22,13 @@ class DialogBase(Controls):
     
     DISPOSE = True
     POS_SIZE = 0,0,0,0
+    #The awt Toolkit is a process-wide service; created on first execute
+    _toolkit = None
+    #get_top_window result, reused for TOP_WINDOW_TTL seconds so a burst of
+    #dialogs doesn't walk the desktop frames for each one
+    TOP_WINDOW_TTL = 2.0
+    _cached_top_window = None
+    _cached_top_window_ts = 0
     
     def __init__(self, ctx, cast, parent_window = None, **props): 
         self.ctx = ctx
@@ -46,11 +54,11 @@ class DialogBase(Controls):
         else:
             title = "no name"
         
-        dlg_mod.setPropertyValues(
-            ('Height','PositionX','PositionY','Width',), 
-            (height, x, y, width,) )
-        if len(props) > 0:
-            dlg_mod.setPropertyValues(tuple(props.keys()), tuple(props.values()))
+        #One setPropertyValues call, names sorted as the model expects
+        values = {'Height': height, 'PositionX': x, 'PositionY': y, 'Width': width}
+        values.update(props)
+        names = tuple(sorted(values))
+        dlg_mod.setPropertyValues(names, tuple(map(values.__getitem__, names)))
         dlg.setModel(dlg_mod)
         #Don't show dialog right away
         dlg.setVisible(False)
@@ -97,7 +105,16 @@ class DialogBase(Controls):
         
         
     def get_top_window(self):
+        now = time.monotonic()
+        if (DialogBase._cached_top_window is not None
+                and now - DialogBase._cached_top_window_ts < self.TOP_WINDOW_TTL):
+            return DialogBase._cached_top_window
+        window = self._find_top_window()
+        DialogBase._cached_top_window = window
+        DialogBase._cached_top_window_ts = now
+        return window
         
+    def _find_top_window(self):
         desktop = createUnoService('com.sun.star.frame.Desktop')
         frames = desktop.getFrames()
         cf = []
@@ -110,35 +127,10 @@ class DialogBase(Controls):
                 return window
         return window
     
-    def _save_current_position(self):
-            'Save x and y position for dialog'
-            'TODO: Fix this function'
-            return
-            ps = self._dialog.PosSize
-            x = int(ps.X / 2.4)
-            y = int(ps.Y / 1.87)
-            #Check top and left boundaries
-            if x < 0: x = 0
-            if y < 0: y = 0
-            #check bottom and right boundaries
-            size = self.parent.frame.frame.window.Size
-            mw_width = int(size.Width / 2.4)
-            mw_height = int(size.Height / 1.87)
-            dlg_width = self._dialog_model.Width
-            dlg_height = self._dialog_model.Height
-            if x + dlg_width > mw_width:
-                x = mw_width - dlg_width
-            if y + dlg_height > mw_height:
-                y = mw_height - dlg_height
-                
-            self._dialog_model.setPropertyValues( 
-                ('PositionX','PositionY'), 
-                (x, y,) )
-                
-            
-        
     def execute(self):
-        toolkit = self.create_service("com.sun.star.awt.Toolkit")
+        toolkit = DialogBase._toolkit
+        if toolkit is None:
+            toolkit = DialogBase._toolkit = self.create_service("com.sun.star.awt.Toolkit")
         self._dialog.createPeer(toolkit, self.parent_window)
         self._prepare()
         #Actual execution
@@ -151,8 +143,6 @@ class DialogBase(Controls):
         if self.DISPOSE:
             self._dispose()
             self._dialog.dispose()
-        else:
-            self._save_current_position()
         return ret
         
     def show(self):
@@ -164,8 +154,7 @@ class DialogBase(Controls):
     def hide(self):
         if not self._dialog.isVisible():
             return
-        #Save the position
-        self._save_current_position()
+        #Save the position for show()
         ps = self._dialog.getPosSize()
         self._position_x = ps.X
         self._position_y = ps.Y
@@ -176,6 +165,19 @@ class DialogBase(Controls):
         self._ret = ret
         self._dialog.endExecute()
         
+    def add_controls(self, spec):
+        '''Add the controls described by spec, usually a class-level _LAYOUT
+        
+        spec is a sequence of (method_name, args) or (method_name, args, kwargs)
+        entries, e.g. ('add_edit', ('name', 10, 21, 130, 13)). Controls whose
+        name (the first arg) is already on the dialog are skipped.
+        '''
+        controls = self._controls
+        for method_name, args, *kwargs in spec:
+            if args[0] in controls:
+                continue
+            getattr(self, method_name)(*args, **(kwargs[0] if kwargs else {}))
+        
     def _create(self):
         'Implement this to create the dialog'
         
@@ -200,26 +202,6 @@ class DialogBase(Controls):
         for prop,value in props.items():
             ctr.setPropertyValue(prop,value)
     
-    def add_control(self, s_type, name, x, y, width, height, page = None, **props):
-        '''Add a control to the dialog'''
-        if page is not None:
-            dlg = page
-            model = page.Model
-        else:
-            dlg = self._dialog
-            model = self._dialog_model
-        #create the control
-        ctr_mod = model.createInstance(s_type)
-        #set the controls properties
-        ctr_mod.setPropertyValues(
-                ("Height", "PositionX", "PositionY", "Width", "Name" ),
-                (height, x, y, width, name))
-        if len(props) > 0:
-            ctr_mod.setPropertyValues(tuple(props.keys()), tuple(props.values()))
-        #insert the control
-        model.insertByName(name, ctr_mod)
-        return dlg.getControl(name)
-
 
 
 class DialogFake():
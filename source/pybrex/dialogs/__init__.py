@@ -5,13 +5,8 @@
 # Copyright (C) 2018, Timothy Hoover
 
 
-import traceback
-
-
 from librepy.pybrex.dialogs.misc_dialogs import DialogList
 
-from librepy.pybrex.msgbox import msgbox
-
 import logging
 logger = logging.getLogger(__name__)
 
@@ -24,35 +19,39 @@ class Dialogs(object):
         self.smgr = smgr
         self.parent = parent
         self.dialog_list = DialogList()
-        self.name = None
+        #Open dialog instances by name
+        self._instances = {}
+        #One factory per registered dialog, so dialogs.NameInput(...) is a
+        #plain dict lookup and carries no shared per-call state
+        self._factories = {name: self._make_factory(name, dlg_class)
+            for name, dlg_class in self.dialog_list.dialogs.items()}
         
     def __getattr__(self, name):
         if name[:1] == '_':
-            return False
-        else:
-            self.name = name
-            return self._get_dialog
+            raise AttributeError(name)
+        try:
+            return self._factories[name]
+        except KeyError:
+            raise AttributeError(name)
             
-
-    def _get_dialog(self, *args, **kwargs):
-        name = self.name
-        dlg = getattr(self, '_%s' % name)
-        if not dlg or dlg._dialog.getAccessibleContext() is None:
-            #get the dialog class
-            dlg_class = self.dialog_list.dialogs[name] #getattr(self.dialog_list, name)
-            #initialize dialog 
-            dlg = dlg_class(self.ctx, self.parent, *args, **kwargs) 
-            setattr(self, '_%s' % name, dlg)
-        return getattr(self, '_%s' % name)
+    def _make_factory(self, name, dlg_class):
+        instances = self._instances
+        def get_dialog(*args, **kwargs):
+            dlg = instances.get(name)
+            if dlg is None or dlg._dialog.getAccessibleContext() is None:
+                #initialize dialog 
+                dlg = dlg_class(self.ctx, self.parent, *args, **kwargs) 
+                instances[name] = dlg
+            return dlg
+        return get_dialog
         
     def dispose(self):
         #Dispose all dialogs that exist
         try:
-            for name in self.dialog_list.dialogs:
-                dlg = getattr(self, '_%s' % name)
-                if not dlg or dlg._dialog.getAccessibleContext() is None:
-                    pass
-                else:
-                    dlg._dialog.dispose()
-        except Exception as e:
-            msgbox('Failed to dispose dialogs.\n%s' % traceback.format_exc())
+            for dlg in self._instances.values():
+                dialog = dlg._dialog
+                if dialog.getAccessibleContext() is not None:
+                    dialog.dispose()
+            self._instances.clear()
+        except Exception:
+            logger.exception("Failed to dispose dialogs")
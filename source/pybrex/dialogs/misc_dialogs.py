@@ -22,43 +22,42 @@ PyBrex dialog framework while providing simplified interfaces for common dialog
 """
 
 
-from librepy.pybrex.msgbox import msgbox
 from librepy.pybrex.dialog import DialogBase, DialogFake
-from librepy.pybrex.my_mri import mri
 
 
 import os
+import types
+import platform
+import atexit
+import threading
+import weakref
 import uno, unohelper
 import time, traceback
 
-from com.sun.star.ui.dialogs.TemplateDescription import FILEOPEN_SIMPLE, FILESAVE_SIMPLE
-from com.sun.star.awt.PosSize import POSSIZE, SIZE
+from com.sun.star.awt.PosSize import SIZE
 from com.sun.star.awt import XWindowListener
+from com.sun.star.beans import PropertyValue
 
 import logging
 logger = logging.getLogger(__name__)
 
-class NameInputDlg(DialogBase):
-    """Simple dialog for getting a text input from the user.
+#ColorPickerDlg uses the Java color chooser on Windows
+_IS_WINDOWS = platform.system() == 'Windows'
+
+class _SimpleInputMixin(object):
+    """Shared behaviour of the small one-field dialogs below.
     
-    Properties:
-        POS_SIZE: (0, 0, 150, 60) - Default dialog dimensions
-        DISPOSE: True - Dialog gets disposed after closing
+    Subclasses implement _create and name the control to focus in
+    _focus_control. execute(values) fills the dialog from values and
+    returns (ret, values) with the user's input.
     """
     
     POS_SIZE = 0, 0, 150, 60
     DISPOSE = True
-    
-    def __init__(self, ctx, cast, Title = 'Enter name', **props):
-        DialogBase.__init__(self, ctx, cast, Title = Title, **props)
-    
-    def _create(self):
-        self.add_ok_cancel()
-        self.add_label('NameLabel', 10, 10, 100, 11, Label = '~Name:')
-        self.add_edit('name', 10, 21, 130, 13)
+    _focus_control = 'name'
     
     def _prepare(self):
-        self._controls['name'].setFocus()
+        self._controls[self._focus_control].setFocus()
     
     def _done(self, ret):
         self.get_values()
@@ -71,40 +70,51 @@ class NameInputDlg(DialogBase):
         return DialogBase.execute(self)
         
         
-class ValueInputDlg(DialogBase):
-    """Simple dialog for getting a numeric value input from the user.
+class NameInputDlg(_SimpleInputMixin, DialogBase):
+    """Simple dialog for getting a text input from the user.
     
     Properties:
         POS_SIZE: (0, 0, 150, 60) - Default dialog dimensions
         DISPOSE: True - Dialog gets disposed after closing
     """
     
-    POS_SIZE = 0, 0, 150, 60
-    DISPOSE = True
-    
-    def __init__(self, ctx, cast, Title = 'Enter value', **props):
+    def __init__(self, ctx, cast, Title = 'Enter name', **props):
         DialogBase.__init__(self, ctx, cast, Title = Title, **props)
     
+    _LAYOUT = (
+        ('add_label', ('NameLabel', 10, 10, 100, 11), {'Label': '~Name:'}),
+        ('add_edit', ('name', 10, 21, 130, 13)),
+    )
+    
     def _create(self):
         self.add_ok_cancel()
-        self.add_label('NameLabel', 10, 10, 100, 11, Label = '~Value:')
-        self.add_numeric('value', 10, 21, 130, 13)
+        self.add_controls(self._LAYOUT)
+        
+        
+class ValueInputDlg(_SimpleInputMixin, DialogBase):
+    """Simple dialog for getting a numeric value input from the user.
     
-    def _prepare(self):
-        self._controls['value'].setFocus()
+    Properties:
+        POS_SIZE: (0, 0, 150, 60) - Default dialog dimensions
+        DISPOSE: True - Dialog gets disposed after closing
+    """
     
-    def _done(self, ret):
-        self.get_values()
-        return ret, self._values
+    _focus_control = 'value'
     
-    def execute(self, values):
-        self.clear_values()
-        self._values = values
-        self.set_values(values)
-        return DialogBase.execute(self)
+    def __init__(self, ctx, cast, Title = 'Enter value', **props):
+        DialogBase.__init__(self, ctx, cast, Title = Title, **props)
+    
+    _LAYOUT = (
+        ('add_label', ('NameLabel', 10, 10, 100, 11), {'Label': '~Value:'}),
+        ('add_numeric', ('value', 10, 21, 130, 13)),
+    )
+    
+    def _create(self):
+        self.add_ok_cancel()
+        self.add_controls(self._LAYOUT)
         
         
-class ConfirmYesDlg(DialogBase):
+class ConfirmYesDlg(_SimpleInputMixin, DialogBase):
     """Dialog that requires user to type 'yes' to confirm an action.
     
     A safety dialog for potentially dangerous operations that requires explicit 
@@ -120,19 +130,21 @@ class ConfirmYesDlg(DialogBase):
             int: 1 if user typed 'yes', 0 otherwise or if cancelled
     """
     
-    POS_SIZE = 0, 0, 150, 60
-    DISPOSE = True
+    _focus_control = 'text'
+    #Takes no values, unlike the other simple dialogs
+    execute = DialogBase.execute
     
     def __init__(self, ctx, cast, Title = 'Authorize', **props):
         DialogBase.__init__(self, ctx, cast, Title = Title, **props)
     
+    _LAYOUT = (
+        ('add_label', ('NameLabel', 10, 10, 130, 11), {'Label': '~Enter yes to continue:'}),
+        ('add_edit', ('text', 10, 21, 130, 13)),
+    )
+    
     def _create(self):
         self.add_ok_cancel()
-        self.add_label('NameLabel', 10, 10, 130, 11, Label = '~Enter yes to continue:')
-        self.add_edit('text', 10, 21, 130, 13)
-    
-    def _prepare(self):
-        self._controls['text'].setFocus()
+        self.add_controls(self._LAYOUT)
     
     def _done(self, ret):
         if ret != 1:
@@ -163,21 +175,65 @@ def get_selected_file_path(ctx, path, name = None, mode='open', filters = (('All
     """
     dlg = FilePickerDlg(ctx, None, Title = 'Select file')
     urls = dlg.execute(path, name = name, dlg_mode = mode, multi_selection = False, filters = filters)
-    
-    if urls is None or urls[0] is None or urls[0] == '':
+    if not urls or not urls[0]:
         return None
-    
-    if len(urls) > 1:
-        paths = []
-        for path in urls:
-            paths.append(uno.fileUrlToSystemPath(path))
-        return paths
-    else:
-        path = uno.fileUrlToSystemPath(urls[0])
-        return path
+    paths = list(map(uno.fileUrlToSystemPath, urls))
+    return paths if len(paths) > 1 else paths[0]
         
         
         
+class _PickerWindowListener(unohelper.Base, XWindowListener):
+    '''Keeps a picker window at its dialog's POS_SIZE
+    
+    One instance is registered on every cached picker window. execute()
+    points it at the running FilePickerDlg/FolderPickerDlg through a weak
+    reference, so a finished dialog isn't kept alive by the listener.
+    '''
+    def __init__(self):
+        self._target = None
+        
+    def set_target(self, ref):
+        self._target = ref
+        
+    def _get_target(self):
+        ref = self._target
+        return ref() if ref is not None else None
+        
+    def disposing(self, ev): pass
+    def windowMoved(self, ev): pass
+    def windowShown(self, ev): 
+        'Set the pos and size'
+        parent = self._get_target()
+        if parent is None:
+            return
+        try:
+            window = parent.f_dlg.Window
+            want_w, want_h = parent.POS_SIZE[2], parent.POS_SIZE[3]
+            #Pickers usually reopen at the size they were left at
+            sz = window.Size
+            if abs(sz.Width - want_w) > 1 or abs(sz.Height - want_h) > 1:
+                window.setPosSize(0, 0, want_w, want_h, SIZE)
+        except:
+            logger.warn(traceback.format_exc())
+            
+    def windowHidden(self, ev):
+        'Get the pos and size'
+        parent = self._get_target()
+        if parent is None:
+            return
+        try:
+            pos_size = parent.f_dlg.Window.Size
+            parent.POS_SIZE = 0, 0, pos_size.Width, pos_size.Height
+        except:
+            logger.error('Error when hiding window.')
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(traceback.format_exc())
+    
+    def windowResized(self, ev): pass
+
+_PICKER_LISTENER = _PickerWindowListener()
+
+
 class FilePickerDlg(object):
     """This class provides a simplified interface to LibreOffice's file picker dialog,
     handling common operations like:
@@ -212,82 +268,72 @@ class FilePickerDlg(object):
     
     POS_SIZE = 0, 0, 800, 600
     DISPOSE = True
+    #Native pickers are slow to create the first time, so one picker is kept
+    #per (mode, multi_selection, filters) and reused. Filters can't be removed
+    #from a picker, which is why they are part of the key.
+    _picker_cache = {}
+    _picker_lock = threading.Lock()
     
     def __init__(self, ctx, cast, Title = 'File selection', **props):
         self.ctx = ctx
         self.cast = cast
         self._dialog = DialogFake(True)
         
+    @classmethod
+    def _get_picker(cls, ctx, mode, multi_selection, filters):
+        '''Return the cached picker for this configuration'''
+        key = (mode, multi_selection, filters)
+        with cls._picker_lock:
+            f_dlg = cls._picker_cache.get(key)
+            if f_dlg is None:
+                f_dlg = ctx.getServiceManager().createInstanceWithArgumentsAndContext(
+                    "com.sun.star.ui.dialogs.FilePicker", (mode,), ctx)
+                #Allow multiselection
+                f_dlg.setMultiSelectionMode(multi_selection)
+                #Hide the help button    
+                try:
+                    f_dlg.setControlProperty('HelpButton', 'Visible', False)
+                except:
+                    pass
+                #Set filters
+                if filters is not None:
+                    for name, filter in filters:
+                        f_dlg.appendFilter(name, filter)
+                #Add listener to set open size
+                try:
+                    f_dlg.Window.addWindowListener(_PICKER_LISTENER)
+                except:
+                    pass
+                cls._picker_cache[key] = f_dlg
+            return f_dlg
         
     def execute(self, folder, name = None, dlg_mode='open', filters = (('Python files', '*.py'), ('All files', '*')), multi_selection = False):
         f = None
-        if dlg_mode.lower() == 'save':
-            mode = FILESAVE_SIMPLE
-        else:
-            mode = FILEOPEN_SIMPLE
-        #Create dialog instance
-        f_dlg = self.ctx.getServiceManager().createInstanceWithArgumentsAndContext(
-            "com.sun.star.ui.dialogs.FilePicker", (mode,), self.ctx)
-            
-        #Allow multiselection
-        f_dlg.setMultiSelectionMode(multi_selection)
-        #Hide the help button    
-        try:
-            f_dlg.setControlProperty('HelpButton', 'Visible', False)
-        except:
-            pass
-        
-        #Add listener to set open size
+        #Only needed once a file picker is actually shown
+        from com.sun.star.ui.dialogs.TemplateDescription import FILEOPEN_SIMPLE, FILESAVE_SIMPLE
+        is_save = dlg_mode.lower() == 'save'
+        mode = FILESAVE_SIMPLE if is_save else FILEOPEN_SIMPLE
+        if filters is not None:
+            filters = tuple(tuple(flt) for flt in filters)
+        #Get the dialog instance
+        f_dlg = self._get_picker(self.ctx, mode, multi_selection, filters)
         self.f_dlg = f_dlg
-        try:
-            f_dlg.Window.addWindowListener(self.WindowListener(self))
-        except:
-            pass
+        _PICKER_LISTENER.set_target(weakref.ref(self))
         
-        
-        #Set the current folder if it exists
+        #Set the current folder if it exists; otherwise the cached picker
+        #deliberately stays in the directory it was last left in
         if os.path.exists(folder):
             f_url = uno.systemPathToFileUrl(folder)
             f_dlg.setDisplayDirectory(f_url)
-        #Set the name 
-        if dlg_mode == 'save' and name is not None:
-            f_dlg.setDefaultName(name)
-        #Set filters
-        if filters is not None:
-            for name, filter in filters:
-                f_dlg.appendFilter(name, filter)
+        #Set the name, clearing the one left over from the previous call
+        if is_save:
+            f_dlg.setDefaultName(name or '')
         #Get the selected file
         if f_dlg.execute() == 1:
             f = f_dlg.SelectedFiles
-        f_dlg.dispose()
         return f
         
         
-    class WindowListener(unohelper.Base, XWindowListener):
-        '''Window resizing'''
-        def __init__(self, parent):
-            self.parent = parent
-            
-        def disposing(self, ev): pass
-        def windowMoved(self, ev): pass
-        def windowShown(self, ev): 
-            'Set the pos and size'
-            try:
-                self.parent.f_dlg.Window.setPosSize(0, 0, self.parent.POS_SIZE[2], self.parent.POS_SIZE[3], SIZE)
-            except:
-                logger.warn(traceback.format_exc())
-                
-        def windowHidden(self, ev):
-            'Get the pos and size'
-            try:
-                ps = self.parent.POS_SIZE
-                pos_size = self.parent.f_dlg.Window.Size
-                self.parent.POS_SIZE = 0, 0, pos_size.Width, pos_size.Height
-            except:
-                logger.error('Error when hiding window.')
-                logger.debug(traceback.format_exc())
-        
-        def windowResized(self, ev): pass
         
 
 def get_selected_folder_path(ctx, path):
@@ -309,68 +355,56 @@ class FolderPickerDlg(object):
         DISPOSE: True - Dialog gets disposed after closing
         
     Methods:
-        execute(folder=os.getcwd()): 
-            Shows folder picker starting at specified path
+        execute(folder=None): 
+            Shows folder picker starting at specified path (default: current directory)
             Returns selected folder path or None if cancelled
     """
     
     POS_SIZE = 0, 0, 800, 600
     DISPOSE = True
+    #The native folder picker is created once and reused, like FilePickerDlg
+    _picker_cache = {}
+    _picker_lock = threading.Lock()
     
     def __init__(self, ctx, cast, Title = 'Select folder', **props):
         self.ctx = ctx
         self.cast = cast
         self._dialog = DialogFake(True)
         
-        
-    def execute(self, folder = os.getcwd()):
+    @classmethod
+    def _get_picker(cls, ctx):
+        '''Return the cached picker'''
+        with cls._picker_lock:
+            f_dlg = cls._picker_cache.get(None)
+            if f_dlg is None:
+                f_dlg = ctx.getServiceManager().createInstanceWithContext(
+                    "com.sun.star.ui.dialogs.FolderPicker", ctx)
+                #Hide the help button    
+                f_dlg.setControlProperty('HelpButton', 'Visible', False)
+                f_dlg.Window.addWindowListener(_PICKER_LISTENER)
+                cls._picker_cache[None] = f_dlg
+            return f_dlg
+        
+    def execute(self, folder = None):
         f = None
-        #Create dialog instance
-        f_dlg = self.ctx.getServiceManager().createInstanceWithContext(
-            "com.sun.star.ui.dialogs.FolderPicker", self.ctx)
+        if folder is None:
+            folder = os.getcwd()
+        #Get the dialog instance
+        f_dlg = self._get_picker(self.ctx)
         self.f_dlg = f_dlg
-        #Hide the help button    
-        f_dlg.setControlProperty('HelpButton', 'Visible', False)
-        #Set the current folder if it exists
-        if os.path.exists(folder):
-            f_url = uno.systemPathToFileUrl(folder)
-            f_dlg.setDisplayDirectory(f_url)
-            
-        f_dlg.Window.addWindowListener(self.WindowListener(self))
+        _PICKER_LISTENER.set_target(weakref.ref(self))
+        #Start in folder; the picker rejects paths that don't exist
+        try:
+            f_dlg.setDisplayDirectory(uno.systemPathToFileUrl(folder))
+        except Exception:
+            pass
             
         #Get the selected file
         if f_dlg.execute() == 1:
             f = f_dlg.getDirectory()
-            
-        f_dlg.dispose()
         
         return f
         
-    class WindowListener(unohelper.Base, XWindowListener):
-        '''Window resizing'''
-        def __init__(self, parent):
-            self.parent = parent
-            
-        def disposing(self, ev): pass
-        def windowMoved(self, ev): pass
-        def windowShown(self, ev): 
-            'Set the pos and size'
-            try:
-                self.parent.f_dlg.Window.setPosSize(0, 0, self.parent.POS_SIZE[2], self.parent.POS_SIZE[3], SIZE)
-            except:
-                logger.warn(traceback.format_exc())
-                
-        def windowHidden(self, ev):
-            'Get the pos and size'
-            try:
-                ps = self.parent.POS_SIZE
-                pos_size = self.parent.f_dlg.Window.Size
-                self.parent.POS_SIZE = 0, 0, pos_size.Width, pos_size.Height
-            except:
-                logger.error('Error when hiding window.')
-                logger.debug(traceback.format_exc())
-        
-        def windowResized(self, ev): pass
      
      
      
@@ -403,9 +437,7 @@ class ColorPickerDlg(object):
         #Get the system type and use java color picker if it is Windows
         #At some point we should check into why it is crashing with
         # the libreoffice dialog
-        logger.debug("My system is %s" % platform.system())
-        
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             logger.debug("Using Java color chooser")
             tools = self.ctx.getServiceManager().createInstance("kptools.KpTools")
             
@@ -436,6 +468,32 @@ class ColorPickerDlg(object):
             return props[0].Value
 
 
+def _dispose_cached_pickers():
+    '''Dispose the pickers kept by FilePickerDlg and FolderPickerDlg'''
+    for cls in (FilePickerDlg, FolderPickerDlg):
+        with cls._picker_lock:
+            entries = list(cls._picker_cache.values())
+            cls._picker_cache.clear()
+        for f_dlg in entries:
+            try:
+                f_dlg.dispose()
+            except Exception:
+                pass
+
+atexit.register(_dispose_cached_pickers)
+
+
+#Read-only name -> class registry shared by every DialogList
+_DIALOGS = types.MappingProxyType({
+    'NameInput': NameInputDlg,
+    'ValueInput': ValueInputDlg,
+    'ConfirmYes': ConfirmYesDlg,
+    'FilePicker': FilePickerDlg,
+    'FolderPicker': FolderPickerDlg,
+    'ColorPicker': ColorPickerDlg,
+})
+
+
 class DialogList:
     """Registry of all available dialogs in this module.
     
@@ -450,15 +508,7 @@ class DialogList:
         - FolderPicker: Folder selection dialog
         - ColorPicker: Color selection dialog
     """
-    def __init__(self):
-        self.dialogs = {
-            'NameInput': NameInputDlg,
-            'ValueInput': ValueInputDlg,
-            'ConfirmYes': ConfirmYesDlg,
-            'FilePicker': FilePickerDlg,
-            'FolderPicker': FolderPickerDlg,
-            'ColorPicker': ColorPickerDlg,
-        }
+    dialogs = _DIALOGS
 
 
         
@@ -7,10 +7,16 @@ It could also be used to tie events to the toolbar and menubar.
 '''
 
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Set
-#from dataclasses import dataclass
 import logging
+import threading
 import traceback
+import weakref
+
+import uno
+
+from librepy.pybrex.frame import call_in_ui_thread
 
 logger = logging.getLogger(__name__)
 
@@ -25,119 +31,212 @@ class EventType(Enum):
     MENUBAR_UPDATE = "menubar_update"
     FRAME_DISPOSE = "frame_dispose"
 
-#@dataclass
 class Event:
     """Event data container"""
-    type = None
-    source = None
-    data = None
+    __slots__ = ('type', 'source', 'data')
+    
+    def __init__(self, type=None, source=None, data=None):
+        self.type = type
+        self.source = source
+        self.data = data
 
 class EventManager:
-    """Centralized event management system"""
-    _instance = None
+    """Centralized event management system
     
-    def __new__(cls):
-        """Singleton pattern to ensure one event manager instance"""
-        if cls._instance is None:
-            cls._instance = super(EventManager, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    Use get_event_manager() to get the shared instance.
+    """
+    # Event types where only the latest event matters; emit() holds them and
+    # dispatches the newest one per type on the UI thread COALESCE_DELAY
+    # seconds after the first arrived
+    COALESCE = frozenset((EventType.WINDOW_RESIZE, EventType.TOOLBAR_UPDATE, EventType.MENUBAR_UPDATE))
+    COALESCE_DELAY = 0.016
     
     def __init__(self):
-        """Initialize event manager if not already initialized"""
-        if not self._initialized:
-            self._listeners = {
-                set() for event_type in EventType
-            }
-            self._initialized = True
-            logger.info("EventManager initialized")
+        # Tuples are replaced, never mutated, so emit can iterate the
+        # current one directly while handlers subscribe/unsubscribe
+        self._listeners = {event_type: () for event_type in EventType}
+        self._pending = {}
+        self._flush_timer = None
+        self._pending_lock = threading.Lock()
+        # Class-level subscriptions from EventSubscriber: per event type a
+        # tuple of (method name, WeakSet of live instances of that class)
+        self._class_handlers = {event_type: () for event_type in EventType}
+        self._live = {}
+        logger.info("EventManager initialized")
     
     def subscribe(self, event_type, callback):
         """Subscribe to an event type"""
         if not callable(callback):
             raise ValueError("Callback must be callable")
-        self._listeners[event_type].add(callback)
-        logger.debug("Subscribed to {}: {}".format(event_type.value, callback.__qualname__))
+        listeners = self._listeners[event_type]
+        if callback not in listeners:
+            self._listeners[event_type] = listeners + (callback,)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Subscribed to %s: %s", event_type.value, getattr(callback, '__qualname__', callback))
+    
+    def register_class(self, cls, events):
+        """Route events to instances of cls; events maps EventType to a method name"""
+        live = self._live.setdefault(cls, weakref.WeakSet())
+        for event_type, method_name in events.items():
+            self._class_handlers[event_type] += ((method_name, live),)
+        
+    def add_instance(self, obj):
+        """Start delivering the class-registered events to obj"""
+        live = self._live.get(type(obj))
+        if live is not None:
+            live.add(obj)
+    
+    def remove_instance(self, obj):
+        """Stop delivering class-registered events to obj, e.g. on dispose"""
+        live = self._live.get(type(obj))
+        if live is not None:
+            live.discard(obj)
     
     def unsubscribe(self, event_type, callback):
         """Unsubscribe from an event type"""
-        try:
-            self._listeners[event_type].remove(callback)
-            logger.debug("Unsubscribed from {}: {}".format(event_type.value, callback.__qualname__))
-        except KeyError:
+        listeners = self._listeners[event_type]
+        if callback in listeners:
+            self._listeners[event_type] = tuple(cb for cb in listeners if cb != callback)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Unsubscribed from %s: %s", event_type.value, getattr(callback, '__qualname__', callback))
+        else:
             logger.warning("Attempted to unsubscribe non-existent listener: {}".format(callback.__qualname__))
     
     def emit(self, event: Event):
-        """Emit an event to all subscribers"""
-        logger.debug("Emitting event: {}".format(event.type.value))
-        for callback in self._listeners[event.type].copy():  # Copy to allow modification during iteration
+        """Emit an event to all subscribers
+        
+        Events of a COALESCE type are held briefly and only the most recent
+        one per type is delivered.
+        """
+        if event.type in self.COALESCE:
+            with self._pending_lock:
+                self._pending[event.type] = event
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self.COALESCE_DELAY, self._schedule_flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+            return
+        self._dispatch(event)
+        
+    def _schedule_flush(self):
+        """Timer callback; handlers touch windows, so dispatch on the UI thread"""
+        ctx = uno.getComponentContext()
+        call_in_ui_thread(ctx, ctx.ServiceManager, self._flush)
+        
+    def _flush(self):
+        """Deliver the events held back by emit()"""
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = {}
+            self._flush_timer = None
+        for event in pending.values():
+            self._dispatch(event)
+    
+    def _dispatch(self, event):
+        logger.debug("Emitting event: %s", event.type)
+        for callback in self._listeners[event.type]:
             try:
                 callback(event)
             except Exception as e:
                 logger.error("Error in event handler {}: {}".format(callback.__qualname__, e))
                 logger.error(traceback.format_exc())
+        for method_name, live in self._class_handlers[event.type]:
+            for obj in tuple(live):
+                try:
+                    getattr(obj, method_name)(event)
+                except Exception as e:
+                    logger.error("Error in event handler {}.{}: {}".format(type(obj).__qualname__, method_name, e))
+                    logger.error(traceback.format_exc())
 
     def clear_all(self):
         """Clear all event subscriptions"""
         for event_type in self._listeners:
-            self._listeners[event_type].clear()
+            self._listeners[event_type] = ()
         logger.info("All event subscriptions cleared")
 
 
-# Example usage
+@lru_cache(maxsize=None)
+def get_event_manager():
+    """Return the process-wide EventManager, creating it on first use"""
+    return EventManager()
 
-#base_frame.py
 
-from librepy.pybrex.events import EventManager, EventType, Event
-
-class BaseFrame:
-    def __init__(self, parent, ctx, smgr, title="PyBrex Window", frame_name="pybrex_frame", **kwargs):
-        # ... existing init code ...
-        
-        # Get the singleton event manager instance
-        self.event_manager = EventManager()
-
-    def window_resizing(self, width, height):
-        """Handle window resize events"""
-        # Emit resize event
-        self.event_manager.emit(Event(
-            type=EventType.WINDOW_RESIZE,
-            source=self,
-            data={'width': width, 'height': height}
-        ))
-        
-        # Maintain parent notification for backward compatibility
-        if self.parent and hasattr(self.parent, 'window_resizing'):
-            self.parent.window_resizing(width, height)
-
-    def dispose(self):
-        """Clean up window resources"""
-        # Emit dispose event before cleanup
-        self.event_manager.emit(Event(
-            type=EventType.FRAME_DISPOSE,
-            source=self
-        ))
-        # ... rest of dispose code ...
-
-
-#toolbar.py
-from librepy.pybrex.events import EventManager, EventType, Event
-
-class ToolBar(object):
-    def __init__(self, parent, ctx, smgr, frame, toolbar_list, **kwargs):
-        # ... existing init code ...
-        
-        # Get event manager instance and subscribe to resize events
-        self.event_manager = EventManager()
-        self.event_manager.subscribe(EventType.WINDOW_RESIZE, self._handle_resize)
-        
-    def _handle_resize(self, event: Event) -> None:
-        """Handle window resize events"""
-        if event.data:
-            self.resize(event.data['width'], event.data['height'])
-        
-    def dispose(self):
-        """Dispose of the toolbar"""
-        # Unsubscribe from events
-        self.event_manager.unsubscribe(EventType.WINDOW_RESIZE, self._handle_resize)
-        self.container.dispose()
+class EventSubscriber(object):
+    """Mixin for classes whose instances all handle the same events
+    
+    Declare the handlers once on the class:
+        _events_ = {EventType.WINDOW_RESIZE: '_handle_resize'}
+    The class is registered with the event manager when it is defined and
+    each instance is tracked weakly, so there is no per-instance subscribe
+    or unsubscribe.
+    """
+    _events_ = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls._events_:
+            get_event_manager().register_class(cls, cls._events_)
+    
+    def __new__(cls, *args, **kwargs):
+        obj = super().__new__(cls)
+        get_event_manager().add_instance(obj)
+        return obj
+
+
+# Example usage (kept as comments so importing this module defines nothing
+# extra; a real EventSubscriber subclass registers itself on definition)
+#
+# base_frame.py
+#
+# from librepy.pybrex.events import get_event_manager, EventType, Event
+#
+# class BaseFrame:
+#     def __init__(self, parent, ctx, smgr, title="PyBrex Window", frame_name="pybrex_frame", **kwargs):
+#         # ... existing init code ...
+#
+#         # Get the shared event manager instance
+#         self.event_manager = get_event_manager()
+#
+#     def window_resizing(self, width, height):
+#         """Handle window resize events"""
+#         # Emit resize event
+#         self.event_manager.emit(Event(
+#             type=EventType.WINDOW_RESIZE,
+#             source=self,
+#             data={'width': width, 'height': height}
+#         ))
+#
+#         # Maintain parent notification for backward compatibility
+#         if self.parent and hasattr(self.parent, 'window_resizing'):
+#             self.parent.window_resizing(width, height)
+#
+#     def dispose(self):
+#         """Clean up window resources"""
+#         # Emit dispose event before cleanup
+#         self.event_manager.emit(Event(
+#             type=EventType.FRAME_DISPOSE,
+#             source=self
+#         ))
+#         # ... rest of dispose code ...
+#
+#
+# toolbar.py
+# from librepy.pybrex.events import EventSubscriber, get_event_manager, EventType, Event
+#
+# class ToolBar(EventSubscriber):
+#     # Every toolbar gets resize events without subscribing in __init__
+#     _events_ = {EventType.WINDOW_RESIZE: '_handle_resize'}
+#
+#     def __init__(self, parent, ctx, smgr, frame, toolbar_list, **kwargs):
+#         # ... existing init code ...
+#         pass
+#
+#     def _handle_resize(self, event: Event) -> None:
+#         """Handle window resize events"""
+#         if event.data:
+#             self.resize(event.data['width'], event.data['height'])
+#
+#     def dispose(self):
+#         """Dispose of the toolbar"""
+#         get_event_manager().remove_instance(self)
+#         self.container.dispose()
@@ -38,30 +38,28 @@ class ExampleDialog(DialogBase):
     def __init__(self, ctx, cast, **props):
         DialogBase.__init__(self, ctx, cast, **props)
     
+    #Static layout, added by add_controls in _create
+    _LAYOUT = (
+        ('add_groupbox', ('infobox', 11, 10, 240, 120), {'Label': 'Company info', 'FontWeight': 110}),
+        ('add_label', ('NameLabel', 15, 20, 100, 11), {'Label': '~Name:'}),
+        ('add_edit', ('name', 15, 33, 150, 13)),
+        ('add_label', ('Phone1Label', 15, 53, 70, 11), {'Label': 'Phone 1:'}),
+        ('add_edit', ('phone1', 15, 66, 70, 13)),
+        ('add_label', ('Phone2Label', 95, 53, 70, 11), {'Label': 'Phone 2:'}),
+        ('add_edit', ('phone2', 95, 66, 70, 13)),
+        ('add_label', ('FaxLabel', 175, 53, 70, 11), {'Label': 'Fax:'}),
+        ('add_edit', ('fax', 175, 66, 70, 13)),
+        #Path example
+        ('add_label', ('pathLocLabel', 15, 93, 50, 11), {'Label': 'Path location:'}),
+        ('add_edit', ('path_location', 15, 106, 200, 11)),
+    )
+    
     def _create(self):
         'Create method'
         self.add_ok_cancel()
-        x, y = 15, 10
-        self.add_groupbox('infobox', x-4, y, 240, 120, Label = 'Company info', FontWeight = 110)
-        y += 10
-        self.add_label('NameLabel', x, y, 100, 11, Label = '~Name:')
-        self.add_edit('name', x, y+13, 150, 13)
-        y += 33
-        self.add_label('Phone1Label', x, y, 70, 11, Label = "Phone 1:")
-        self.add_edit('phone1', x, y+13, 70, 13)
-        self.add_label('Phone2Label', x+80, y, 70, 11, Label = "Phone 2:")
-        self.add_edit('phone2', x+80, y+13, 70, 13)
-        self.add_label('FaxLabel', x+160, y, 70, 11, Label = "Fax:")
-        self.add_edit('fax', x+160, y+13, 70, 13)
-        
-        #Path example
-        y += 40
-        self.add_label('pathLocLabel', x, y, 50, 11, Label = 'Path location:')
-        y += 13
-        ctr = self.add_edit('path_location', x, y, 200, 11)
-        
-        self.add_button('browse_path_loc', x + 210, y, 15, 13, Label = '...', callback = self.browse_path_clicked)
-        y += 22
+        self.add_controls(self._LAYOUT)
+        #Needs a bound callback, so it can't be part of _LAYOUT
+        self.add_button('browse_path_loc', 225, 106, 15, 13, Label = '...', callback = self.browse_path_clicked)
         
         
     def select_file(self, base_path,  filters = (('Image files', '*.png'), ('All files', '*'))):
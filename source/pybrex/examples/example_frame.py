@@ -74,10 +74,10 @@ class ExampleWindow(object):
         self.smgr = ctx.getServiceManager()
         
         # Set position and size of window with defaults
-        posx = args['posx'] if 'posx' in args else 100
-        posy = args['posy'] if 'posy' in args else 100
-        width = args['width'] if 'width' in args else 400
-        height = args['height'] if 'height' in args else 400
+        posx = args.get('posx', 100)
+        posy = args.get('posy', 100)
+        width = args.get('width', 400)
+        height = args.get('height', 400)
         
         # Create main frame
         self.frame = frame.Frame(self, self.ctx, self.smgr, 
@@ -137,7 +137,7 @@ class ExampleWindow(object):
 def test():
     
     def tester(**args):
-        posx = args['posx'] if 'posx' in args else 100
+        posx = args.get('posx', 100)
         print(posx)
             
     tester(posx = 10)
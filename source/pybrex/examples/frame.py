@@ -6,7 +6,9 @@
 # Copyright (C) 2018, Timothy Hoover
 
 import unohelper
+import threading
 import traceback
+import weakref
 import os, sys
 import shutil
 from stat import *
@@ -29,122 +31,167 @@ logger = logging.getLogger(__name__)
 
 class Frame(object):
     '''Example frame'''
+    #Seconds to wait for resize events to settle before calling
+    #window_resizing, as in BaseFrame. 0 delivers every event.
+    RESIZE_DEBOUNCE = 0.05
+    
     def __init__(self, parent, ctx, smgr, ps = (100, 100, 100, 100), title = 'My frame', frame_name = 'my_frame', **args):
         self.parent = parent
         self.ctx = ctx
         self.smgr = smgr
+        self._disposed = False
         
         #Create a unique frame name for this window
         self.name = fr_frame.get_frame_name(ctx, smgr, frame_name)
         #Create
         self.frame, self.window = fr_frame.create_frame(ctx, smgr, ps, title, self.name)
         #Set listeners
-        
-        self.listeners = self.set_listeners(parent, ctx, smgr)
+        self.set_listeners(parent, ctx, smgr)
         
 
     def set_listeners(self, parent, ctx, smgr):
         '''Set frame listeners'''
-        listeners = {}
-        lst = FrameCloseListener(self)
-        self.frame.addCloseListener(lst)
-        listeners['close'] = lst
-        lst = WindowListener(self)
-        self.window.addWindowListener(lst)
-        listeners['window'] = lst
-    
-        return listeners
+        self._close_lst = FrameCloseListener(self)
+        self.frame.addCloseListener(self._close_lst)
+        self._window_lst = WindowListener(self)
+        self.window.addWindowListener(self._window_lst)
 
     def remove_listeners(self):
         '''Remove frame listeners'''
-        listeners = self.listeners
-        lst = listeners['window']
-        self.window.removeWindowListener(lst)
-        lst = listeners['close']
-        self.frame.removeCloseListener(lst)
+        #A removed listener never gets disposing, so stop its debounce timer here
+        timer = self._window_lst._timer
+        if timer is not None:
+            timer.cancel()
+            self._window_lst._timer = None
+        self.window.removeWindowListener(self._window_lst)
+        self.frame.removeCloseListener(self._close_lst)
         
     def window_resizing(self, width, height):
         '''Window is being resized'''
         self.parent.window_resizing(width, height)
         
+    def can_close(self):
+        '''Return False here to keep the window from closing'''
+        return True
+        
     def window_closing(self, *args):
         '''Window is being closed'''
         self.dispose()
         
     def dispose(self):
         '''Dispose'''
-        try:
-            self.remove_listeners()
-            #Set window size
-            ps = self.window.PosSize
-            #Every now and then Libreoffice returns incorrect results when closing a frame
-            #When this happens, ignore 
-            if ps.Width < 50 or ps.Height < 50:
-                logger.error("Frame size error!")
-            else:
-                #Save the window position and size for next execution
-                pass
-                #c.fr_width, c.fr_height, c.pos_x, c.pos_y = ps.Width, ps.Height, ps.X, ps.Y
-        except:
-            logger.error(traceback.format_exc())
+        self._disposed = True
+        #Each phase runs even if an earlier one failed
+        for step, fn in (('listeners', self._dispose_listeners),
+                         ('parent', lambda: self.parent.dispose()),
+                         ('frame', lambda: self.frame.dispose())):
+            try:
+                fn()
+            except Exception:
+                logger.error('dispose %s failed', step, exc_info=True)
+                
+    def _dispose_listeners(self):
+        '''Remove the listeners and check the final window size'''
+        self.remove_listeners()
+        #Set window size
+        ps = self.window.PosSize
+        #Every now and then Libreoffice returns incorrect results when closing a frame
+        #When this happens, ignore 
+        if ps.Width < 50 or ps.Height < 50:
+            logger.error("Frame size error!")
+        else:
+            #Save the window position and size for next execution
+            pass
+            #c.fr_width, c.fr_height, c.pos_x, c.pos_y = ps.Width, ps.Height, ps.X, ps.Y
         
-        #Dispose the parent
-        try:
-            self.parent.dispose()
-        except:
-            logger.error(traceback.format_exc())
-            
-        #Dispose myself
-        try:
-            self.frame.dispose()
-        except:
-            logger.error(traceback.format_exc())
+
+class _ParentRef(object):
+    '''Mixin holding the listener's frame weakly, so the frame and its
+    listeners don't form a cycle; parent is None once the frame is gone'''
+    def __init__(self, parent):
+        self._parent_ref = weakref.ref(parent)
+        
+    @property
+    def parent(self):
+        return self._parent_ref()
         
 
-class FrameCloseListener(unohelper.Base, XCloseListener):
+class FrameCloseListener(_ParentRef, unohelper.Base, XCloseListener):
     '''Window closing'''
-    def __init__(self, parent):
-        self.parent = parent
         
     def queryClosing(self, ev, b_owner):
         '''Window close querying'''
-        b_close = True
-        try:
-            #Set b_close to false here to keep window from closing
-            pass
-        except Exception as e:
-            logger.error(traceback.format_exc())
-            
-        if not b_close:
+        parent = self.parent
+        if parent is not None and not parent.can_close():
             #The close veto exception has to be caught by the listener that called this function
             logger.debug('Vetoing close')
             raise CloseVetoException()
         
     def notifyClosing(self, ev): 
+        parent = self.parent
+        if parent is None:
+            return
         try:
             #Dispose before closing
-            self.parent.window_closing()
+            parent.window_closing()
         except Exception as e:
             logger.error(traceback.format_exc())
         
     def disposing(self, ev):
         logger.debug('Close disposing')
 
-class WindowListener(unohelper.Base, XWindowListener):
+class WindowListener(_ParentRef, unohelper.Base, XWindowListener):
     '''Window resizing'''
     def __init__(self, parent):
-        self.parent = parent
+        _ParentRef.__init__(self, parent)
+        self._pending_size = None
+        self._timer = None
+        
+    def disposing(self, ev):
+        #Don't call into a disposed frame
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
         
-    def disposing(self, ev): pass
     def windowMoved(self, ev): pass
     def windowShown(self, ev): pass
     def windowHidden(self, ev): pass
     def windowResized(self, ev):
-        '''Window is resizing'''
+        '''Window is resizing
+        
+        A drag-resize fires many events; only the last size is passed on,
+        once they have paused for parent.RESIZE_DEBOUNCE seconds.
+        '''
+        parent = self.parent
+        if parent is None:
+            return
+        self._pending_size = (ev.Width, ev.Height - 25) #Minus menubar height
+        delay = parent.RESIZE_DEBOUNCE
+        if not delay:
+            self._deliver()
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._flush)
+        self._timer.daemon = True
+        self._timer.start()
+        
+    def _flush(self):
+        '''Timer callback; hand the resize to the UI thread'''
+        self._timer = None
+        parent = self.parent
+        if parent is None:
+            return
+        fr_frame.call_in_ui_thread(parent.ctx, parent.smgr, self._deliver)
+        
+    def _deliver(self):
+        '''Pass the last seen size to the frame'''
+        parent = self.parent
+        #A callback queued before dispose may still arrive
+        if parent is None or parent._disposed:
+            return
         try:
-            width = ev.Width
-            height = ev.Height - 25 #Minus menubar height
-            self.parent.window_resizing(width, height)
+            parent.window_resizing(*self._pending_size)
         except:
             logger.error(traceback.format_exc())
         
@@ -6,10 +6,12 @@
 
  
 from random import randint
+import traceback
+import unohelper
 
 from librepy.pybrex.msgbox import msgbox
 
-from com.sun.star.awt import Rectangle, WindowDescriptor
+from com.sun.star.awt import Rectangle, WindowDescriptor, XCallback
 from com.sun.star.beans import NamedValue, PropertyValue
 from com.sun.star.awt.WindowClass import SIMPLE, CONTAINER, TOP, MODALTOP
 from com.sun.star.awt.VclWindowPeerAttribute import CLIPCHILDREN, HSCROLL, VSCROLL, AUTOVSCROLL
@@ -20,15 +22,46 @@ from com.sun.star.awt.PosSize import POSSIZE, SIZE
 import logging
 logger = logging.getLogger(__name__)
 
+#The Desktop, TaskCreator and Toolkit services are reused, keyed by
+#(id(ctx), service name)
+_service_cache = {}
+
+def _get_service(ctx, smgr, name):
+    '''Return the cached instance of service name for ctx'''
+    key = (id(ctx), name)
+    service = _service_cache.get(key)
+    if service is None:
+        service = _service_cache[key] = smgr.createInstanceWithContext(name, ctx)
+    return service
+
+class _UICallback(unohelper.Base, XCallback):
+    '''Runs fn(*args) when the AsyncCallback service notifies it'''
+    def __init__(self, fn, args):
+        self.fn = fn
+        self.args = args
+        
+    def notify(self, data):
+        try:
+            self.fn(*self.args)
+        except Exception:
+            logger.error(traceback.format_exc())
+
+def call_in_ui_thread(ctx, smgr, fn, *args):
+    '''Queue fn(*args) to run on the VCL main thread
+    
+    For work that touches windows from another thread, such as a
+    threading.Timer. Returns immediately; fn runs from the event loop.
+    '''
+    _get_service(ctx, smgr, 'com.sun.star.awt.AsyncCallback').addCallback(
+        _UICallback(fn, args), None)
+
 def create_frame(ctx, smgr, ps, title, name):
     '''Create a frame'''
-    frame = smgr.createInstanceWithContext(
-        'com.sun.star.frame.TaskCreator', ctx).createInstanceWithArguments(
+    frame = _get_service(ctx, smgr, 'com.sun.star.frame.TaskCreator').createInstanceWithArguments(
         (NamedValue('FrameName', name),
         NamedValue('PosSize', Rectangle(*ps))))
     window = frame.getContainerWindow()
-    desktop = smgr.createInstanceWithContext(
-        'com.sun.star.frame.Desktop', ctx)
+    desktop = _get_service(ctx, smgr, 'com.sun.star.frame.Desktop')
     frame.setTitle(title)
     frame.setCreator(desktop)
     desktop.getFrames().append(frame)
@@ -44,44 +77,39 @@ def create_window(toolkit, parent, wtype, service, attrs, ps):
     aWindowDescriptor.WindowAttributes = attrs
     return toolkit.createWindow(aWindowDescriptor)
         
-def vertical_splitter(toolkit, parent, ps, listener = None):
+#Window peer properties shared by both splitters
+_SPLITTER_PROPS = (
+    ('BackgroundColor', 0xDCDAD5),
+    ('Border', 0),
+    ('Text', '....'))
+
+def _create_splitter(toolkit, parent, ps, scroll, orientation, listener):
         #Create splitter window
         spl = create_window(
             toolkit, parent, 'splitter', SIMPLE, 
-            CLIPCHILDREN | BORDER | SHOW | HSCROLL,
+            CLIPCHILDREN | BORDER | SHOW | scroll,
             ps)
-        #Set attributes
-        spl.setProperty('BackgroundColor', 0xDCDAD5)
-        spl.setProperty('Border',0)
-        spl.setProperty('Text', '....')
-        spl.setProperty('FontOrientation', 2)
+        #Set attributes; a window peer has no setPropertyValues
+        for name, value in _SPLITTER_PROPS:
+            spl.setProperty(name, value)
+        spl.setProperty('FontOrientation', orientation)
         if not listener is None:
             spl.addMouseListener(listener)
             spl.addMouseMotionListener(listener)
         return spl
         
+def vertical_splitter(toolkit, parent, ps, listener = None):
+        return _create_splitter(toolkit, parent, ps, HSCROLL, 2, listener)
+        
 def horizontal_splitter(toolkit, parent, ps, listener = None):
-        #Create splitter window
-        spl = create_window(
-            toolkit, parent, 'splitter', SIMPLE, 
-            CLIPCHILDREN | BORDER | SHOW | VSCROLL,
-            ps)
-        #Set attributes
-        spl.setProperty('BackgroundColor', 0xDCDAD5)
-        spl.setProperty('Border',0)
-        spl.setProperty('Text', '....')
-        spl.setProperty('FontOrientation', 1)
-        if not listener is None:
-            spl.addMouseListener(listener)
-            spl.addMouseMotionListener(listener)
-        return spl
+        return _create_splitter(toolkit, parent, ps, VSCROLL, 1, listener)
         
         
 
 def  create_document(smgr, ctx, window, ps, props, doc_type = 'sdraw'):
     '''Create a drawing document in the window'''
     #Create the window
-    xToolkit = smgr.createInstanceWithContext("com.sun.star.awt.Toolkit", ctx)
+    xToolkit = _get_service(ctx, smgr, "com.sun.star.awt.Toolkit")
     xWindow = create_window(
         xToolkit, window, 'dockingwindow', SIMPLE, CLIPCHILDREN + BORDER + SHOW, ps)
     #create a frame and initialize it with the created window...
@@ -94,17 +122,11 @@ def  create_document(smgr, ctx, window, ps, props, doc_type = 'sdraw'):
         
 def get_frame_name(ctx, smgr, frame_name):
     'Get a unique frame name'
-    my_name = '%s_0000' % frame_name
-    desktop = smgr.createInstanceWithContext('com.sun.star.frame.Desktop', ctx)
+    desktop = _get_service(ctx, smgr, 'com.sun.star.frame.Desktop')
     frames = desktop.getFrames()
-    names = []
-    for i in range(frames.getCount()):
-        n = frames.getByIndex(i).getName()
-        if len(n) == len(my_name) and n.startswith(my_name[:-4]):
-            names.append(n[-4:])
-
-        #Get a unique ID for this session
-    id_n = randint(1000, 9000)
-    id_s = str(id_n)
-    my_name = my_name[:-4] + id_s
+    existing = {frames.getByIndex(i).getName() for i in range(frames.getCount())}
+    #Get a unique ID for this session
+    my_name = '%s_%s' % (frame_name, randint(1000, 9000))
+    while my_name in existing:
+        my_name = '%s_%s' % (frame_name, randint(1000, 9000))
     return my_name
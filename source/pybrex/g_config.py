@@ -5,6 +5,7 @@
 # Copyright (C) 2018, Timothy Hoover
 
 import configparser
+import io
 import uno
 import os
 import traceback
@@ -19,20 +20,40 @@ logger = logging.getLogger(__name__)
 class ConfigBase(dict):
     ''' Config base'''
     def __getattr__(self, name):
-        if name not in self.keys():
-            raise AttributeError
-        else:
-            return super().__getitem__(name)
-        
-    def __setattr__(self, name, value):
-        super().__setitem__(name, value)
+        try:
+            return dict.__getitem__(self, name)
+        except KeyError:
+            raise AttributeError(name) from None
         
-    def __delattr__(self, name):
-        super().__delitem__(name)
+    __setattr__ = dict.__setitem__
+    __delattr__ = dict.__delitem__
         
     def copy(self):
         return ConfigBase(self.items())
     
+    
+class LazyConfig(ConfigBase):
+    '''ConfigBase whose children are read from their file on first access
+    
+    add_path records where a child lives; loader(self, name, path) is
+    called the first time the child is looked up and must set it.
+    '''
+    def __init__(self, loader):
+        super().__init__()
+        object.__setattr__(self, '_loader', loader)
+        object.__setattr__(self, '_paths', {})
+        
+    def add_path(self, name, path):
+        self._paths[name] = path
+        
+    def __getattr__(self, name):
+        if name not in self:
+            path = self._paths.pop(name, None)
+            if path is None:
+                raise AttributeError(name)
+            self._loader(self, name, path)
+        return super().__getattr__(name)
+    
 #Default config files, more configurations are loaded from the configs directory
     
 class MainWindowConfig(ConfigBase):
@@ -80,27 +101,26 @@ class GlobalConfig(object):
         'Load all the configurations files'
         
         #Load user config files
-        setattr(GlobalConfig, 'user', ConfigBase())
+        user_cfg = ConfigBase()
+        setattr(GlobalConfig, 'user', user_cfg)
         self.show = True
-        for name in os.listdir(self.USER_DIR):
-            if name.endswith('.conf'):
-                file_path = os.path.join(self.USER_DIR, name)
-                p_name = name.split('.')[0]
-                self.load_path(getattr(GlobalConfig, 'user'), p_name, file_path)
+        with os.scandir(self.USER_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith('.conf'):
+                    self.load_path(user_cfg, entry.name.split('.')[0], entry.path)
         
-        #Load file type  config files
-        setattr(GlobalConfig, 'filetypes', ConfigBase())
-        for name in os.listdir(self.FILETYPE_DIR):
-            file_path = os.path.join(self.FILETYPE_DIR, name)
-            p_type = name.split('.').pop()
-            self.load_path(getattr(GlobalConfig, 'filetypes'), p_type, file_path)
+        #File type config files are only read when a type is first looked up
+        filetypes = LazyConfig(self.load_path)
+        setattr(GlobalConfig, 'filetypes', filetypes)
+        with os.scandir(self.FILETYPE_DIR) as entries:
+            for entry in entries:
+                filetypes.add_path(entry.name.split('.').pop(), entry.path)
             
         #Set defaults
         set_all_default_configs(GlobalConfig)
             
         #Set old variables for backword compatibility
-        defaults = getattr(GlobalConfig, 'user')
-        user_d = getattr(defaults, 'librepy')
+        user_d = user_cfg.librepy
         setattr(GlobalConfig, 'mw', getattr(user_d, 'mainwindow'))
         setattr(GlobalConfig, 'ed', getattr(user_d, 'editor'))
         
@@ -108,13 +128,12 @@ class GlobalConfig(object):
     def load_path(self, base_obj, child_name, path):
         'Load a single configuration file'
         config = configparser.ConfigParser(interpolation = None)
-        if os.path.exists(path):
-            config.read(path)
-        else:
+        #read() skips a missing file and returns the files it did read
+        if not config.read(path):
             return
             
-        setattr(base_obj, child_name, ConfigBase())
-        base_cfg = getattr(base_obj, child_name)
+        base_cfg = ConfigBase()
+        setattr(base_obj, child_name, base_cfg)
         num = 0
         for name, section in config.items():
             setattr(base_cfg, name, ConfigBase())
@@ -134,16 +153,21 @@ class GlobalConfig(object):
             return True
         elif s == 'false' or s == 'False':
             return False
-            
-        try:
-            val = int(s)
-            return val
-        except: pass
         
-        try:
-            val = float(s)
-            return val
-        except: pass
+        #Only strings that start like a number (or nan/inf) are tried, so
+        #plain text values don't raise and catch two exceptions each
+        if s and (s[0].isdigit() or s[0] in '+-.' or s[:3].lower() in ('nan', 'inf')):
+            digits = s[1:] if s[0] in '+-' else s
+            if digits.isdecimal():
+                return int(s)
+            if '_' in digits:
+                #int() also accepts digit group separators, e.g. 1_000
+                try:
+                    return int(s)
+                except ValueError: pass
+            try:
+                return float(s)
+            except ValueError: pass
         
         return string
                 
@@ -155,7 +179,13 @@ class GlobalConfig(object):
             user_d = getattr(defaults, 'librepy')
             path = os.path.join(self.USER_DIR, 'librepy.conf')
             config = configparser.ConfigParser(interpolation = None)
-            config.read(path)
+            try:
+                with open(path) as f:
+                    old_text = f.read()
+            except FileNotFoundError:
+                old_text = None
+            if old_text:
+                config.read_string(old_text, path)
             
             #Set current configuration
             for sect_name, sect_section in user_d.items():
@@ -169,9 +199,15 @@ class GlobalConfig(object):
                 for conf_name, conf_val in sect_section.items():
                     config[sect_name][conf_name] = str(conf_val)
                     
-            #Write to file
-            with open(path, 'w') as f:
-                config.write(f)
+            #Write to file, unless it would come out the same
+            buf = io.StringIO()
+            config.write(buf)
+            new_text = buf.getvalue()
+            if new_text != old_text:
+                with open(path, 'w') as f:
+                    f.write(new_text)
+            else:
+                logger.debug('Config unchanged, not rewriting %s', path)
                 
         except Exception as e:
             msgbox(traceback.format_exc()) 
@@ -14,6 +14,23 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+#Column type -> factory of a function pulling that column's cell from a data row
+_EXTRACTORS = {
+    1: lambda k: lambda r: r[k],
+    2: lambda k: lambda r: 'Y' if r[k] else 'N',
+    3: lambda k: lambda r: r[k].replace('\n', ', '),
+}
+
+#Column type -> function(data row, key) used by data_value for single cells
+_CELL_VALUE = {
+    1: lambda d, k: d[k],
+    2: lambda d, k: 'Y' if d[k] else 'N',
+    3: lambda d, k: d[k].replace('\n', ', '),
+}
+
+def _no_value(r):
+    return None
+
 
 class GridBase(object):
     '''
@@ -34,6 +51,25 @@ class GridBase(object):
             self.color1 = props['color1']
         if 'color2' in props:
             self.color2 = props['color2']
+        #Alternating row colors reused by set_last_line_color
+        self._stripes = ()
+            
+    @property
+    def titles(self):
+        return self._titles
+        
+    @titles.setter
+    def titles(self, titles):
+        #Resolve each column's type once rather than per cell
+        self._titles = titles
+        self._extractors = self._compile_extractors(titles)
+        self._all_columns = tuple(range(len(self._extractors)))
+        
+    def _compile_extractors(self, titles):
+        '''Return one cell extractor per title, see data_value'''
+        return tuple(
+            _EXTRACTORS[title[3]](title[1]) if title[3] in _EXTRACTORS else _no_value
+            for title in titles)
 
     def _build_default_props(self, name, x, y, width, height, **props):
         d = {
@@ -49,10 +85,18 @@ class GridBase(object):
             "UseGridLines": True,
             "HeaderBackgroundColor": GRID_HEADER_BG_COLOR,
             "ShowColumnHeader": True,
-            "ShowRowHeader": False
+            "ShowRowHeader": False,
+            "RowBackgroundColors": (self.color1, self.color2),
         }
         d.update(props)
         return d
+        
+    def _set_model_props(self, grid_model, columns):
+        '''Set default_props and the column model in one call'''
+        values = dict(self.default_props, ColumnModel = columns)
+        #setPropertyValues expects the names sorted
+        names = tuple(sorted(values))
+        grid_model.setPropertyValues(names, tuple(map(values.__getitem__, names)))
 
     def _initialise_data_model(self, grid_model):
         dm = grid_model.GridDataModel
@@ -64,7 +108,8 @@ class GridBase(object):
     def _create_columns(self, titles):
         columns = self.smgr.createInstanceWithContext("com.sun.star.awt.grid.DefaultGridColumnModel", self.ctx)
         for title in titles:
-            column = self.smgr.createInstanceWithContext("com.sun.star.awt.grid.GridColumn", self.ctx)
+            #The column model's own factory, not a service manager lookup per column
+            column = columns.createColumn()
             column.Title = title[0]
             column.ColumnWidth = title[2]
             columns.addColumn(column)
@@ -82,21 +127,13 @@ class GridBase(object):
         self._ctr = grid_ctr
 
         self.default_props = self._build_default_props(name, x, y, width, height, **props)
-
-        grid_model.setPropertyValues(
-            tuple(self.default_props.keys()),
-            tuple(self.default_props.values())
-        )
-
-        grid_model.RowBackgroundColors = (self.color1, self.color2)
+        
+        columns = self._create_columns(titles)
+        self._set_model_props(grid_model, columns)
 
         grid_ctr.setPosSize(x, y, width, height, POSSIZE)
 
         self._data_model = self._initialise_data_model(grid_model)
-        
-        columns = self._create_columns(titles)
-
-        grid_model.ColumnModel = columns
 
         return grid_ctr, grid_model
     
@@ -106,18 +143,10 @@ class GridBase(object):
         grid_model = dialog_model.createInstance("com.sun.star.awt.grid.UnoControlGridModel")
 
         self.default_props = self._build_default_props(name, x, y, width, height, **props)
-
-        grid_model.setPropertyValues(
-            tuple(self.default_props.keys()),
-            tuple(self.default_props.values())
-        )
-
-        grid_model.RowBackgroundColors = (self.color1, self.color2)
-        self._data_model = self._initialise_data_model(grid_model)
         
         columns = self._create_columns(titles)
-
-        grid_model.ColumnModel = columns
+        self._set_model_props(grid_model, columns)
+        self._data_model = self._initialise_data_model(grid_model)
 
         if page is not None:
             page.Model.insertByName(name, grid_model)
@@ -137,25 +166,20 @@ class GridBase(object):
         if resort:
             #Save the current sort
             sort_props = dm.getCurrentSortOrder()
-        if clear:
+        if clear and dm.RowCount:
             #Clear the grid
             dm.removeAllRows()
-        rows = []
-        headings = []
-        for data_row in data:
-            if heading:
-                headings.append(data_row[heading])
-            row = []
-            for title in self.titles:
-                row.append(self.data_value(data_row, title))
-            rows.append(tuple(row))
-        rows = tuple(rows)
+        extractors = self._extractors
+        #Rows and headings each walk the data, so a generator must be materialised
+        data = tuple(data)
+        rows = tuple(tuple(f(data_row) for f in extractors) for data_row in data)
         if heading:
-            headings = tuple(headings)
+            headings = tuple(data_row[heading] for data_row in data)
         else:
-            headings = tuple(["%s" % i for i in range(len(data))])
+            headings = tuple(map(str, range(len(rows))))
         #Add data to grid
-        dm.addRows(headings, rows)
+        if rows:
+            dm.addRows(headings, rows)
         
         if resort:
             #Resort columns
@@ -166,14 +190,9 @@ class GridBase(object):
         self._data_model.removeAllRows()
         
     def data_value(self, data, title):
-        if title[3] == 1:
-            return data[title[1]]
-        elif title[3] == 2:
-            v = data[title[1]]
-            if v: return 'Y'
-            else: return 'N'
-        elif title[3] == 3:
-            return data[title[1]].replace('\n', ', ')
+        fn = _CELL_VALUE.get(title[3])
+        if fn is not None:
+            return fn(data, title[1])
             
     def active_row_heading(self):
         try:
@@ -195,13 +214,8 @@ class GridBase(object):
     def update(self, data):
         if self.current_row is None:
             return False
-        columns = tuple([i for i,t in enumerate(self.titles)])
-        values = []
-        for t in self.titles:
-            values.append(self.data_value(data, t))
-        values = tuple(values)
-        
-        self._data_model.updateRowData(columns, self.current_row, values)
+        values = tuple(f(data) for f in self._extractors)
+        self._data_model.updateRowData(self._all_columns, self.current_row, values)
         return True
             
     def delete(self):
@@ -211,19 +225,14 @@ class GridBase(object):
         return True
         
     def add(self, data, heading):
-        values = []
-        for t in self.titles:
-            values.append(self.data_value(data, t))
-        self._data_model.addRow(heading, tuple(values))
+        self._data_model.addRow(heading, tuple(f(data) for f in self._extractors))
         
     def set_last_line_color(self, color):
-        colors = []
-        for i in range(0, self._data_model.RowCount - 1, 2):
-            colors += [self.color1, self.color2]
-        if len(colors) == self._data_model.RowCount and len(colors) > 0:
-            colors.pop()
-        colors.append(color)
-        self._model.RowBackgroundColors = tuple(colors)
+        n = max(self._data_model.RowCount - 1, 0)
+        stripes = self._stripes
+        if len(stripes) < n:
+            stripes = self._stripes = (self.color1, self.color2) * (n // 2 + 1)
+        self._model.RowBackgroundColors = stripes[:n] + (color,)
         
     def mouse_doubleclicked(self, ev):
         '''Mouse double clicked function'''
@@ -237,7 +246,6 @@ class GridBase(object):
             return
         #Use only if actually clicked on a row
         row = self._ctr.getRowAtPoint(ev.X, ev.Y)
-        row = self._ctr.getRowAtPoint(ev.X, ev.Y)
         if row == -1:
             return
         #Run the callback function
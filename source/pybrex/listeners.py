@@ -135,6 +135,7 @@ class Listeners(object):
         
         def __init__(self, ctr, step, value):
             self.ctr = ctr
+            self.model = ctr.Model
             self.step = step
             self.value = value
             
@@ -142,18 +143,16 @@ class Listeners(object):
             pass
             
         def up(self, ev):
-            if self.value >= self.ctr.Model.EffectiveMax:
-                self.vaue = self.ctr.Model.EffectiveMax
-            else:
-                self.value += self.step
-            self.ctr.Model.EffectiveValue = self.value
+            self._set_value(min(self.value + self.step, self.model.EffectiveMax))
             
         def down(self, ev):
-            if self.value <= self.ctr.Model.EffectiveMin:
-                self.vaue = self.ctr.Model.EffectiveMain
-            else:
-                self.value -= self.step
-            self.ctr.Model.EffectiveValue = self.value
+            self._set_value(max(self.value - self.step, self.model.EffectiveMin))
+            
+        def _set_value(self, value):
+            #Only write to the model when the clamped value moved
+            if value != self.value:
+                self.value = value
+                self.model.EffectiveValue = value
             
         def first(self, ev):
             pass
@@ -16,7 +16,7 @@ from librepy.pybrex.values import TOOLBAR_GRAPHICS_DIR
 
 from com.sun.star.beans import NamedValue, PropertyValue
 from com.sun.star.awt.MenuItemStyle import CHECKABLE as CHK, AUTOCHECK as ACHK, RADIOCHECK as RCHK
-from com.sun.star.awt import XMenuListener
+from com.sun.star.awt import XMenuListener, KeyEvent
 
 
 import logging
@@ -71,14 +71,7 @@ def create_submenu(parentmenu, menuid, submenu, ctx, smgr, listener):
                 ppm.setAcceleratorKeyEvent(menu.id, create_key_event(ctx, smgr, menu.key))
             #Set graphic
             if menu.graphic is not None:
-                graphic_provider = smgr.createInstanceWithContext('com.sun.star.graphic.GraphicProvider', ctx)
-                g_dir = os.path.join(TOOLBAR_GRAPHICS_DIR, menu.graphic)
-                
-                prop_value = PropertyValue()
-                prop_value.Name = 'URL'
-                prop_value.Value = uno.systemPathToFileUrl(g_dir)
-                graphic = graphic_provider.queryGraphic((prop_value, ))
-                ppm.setItemImage(menu.id, graphic, True)
+                ppm.setItemImage(menu.id, get_graphic(ctx, smgr, menu.graphic), True)
             if menu.submenu:
                 create_submenu(ppm, menu.id, menu.submenu, ctx, smgr, listener)
         else:
@@ -131,66 +124,44 @@ class Menubar(object):
                 logger.error(traceback.format_exc())
                 
 
-def key_map():
-    km = {}
-    km['0'] = 256
-    km['1'] = 257
-    km['2'] = 258
-    km['3'] = 259
-    km['4'] = 260
-    km['5'] = 261
-    km['6'] = 262
-    km['7'] = 263
-    km['8'] = 264
-    km['9'] = 265
-    km['A'] = 512
-    km['B'] = 513
-    km['C'] = 514
-    km['D'] = 515
-    km['E'] = 516
-    km['F'] = 517
-    km['G'] = 518
-    km['H'] = 519
-    km['I'] = 520
-    km['J'] = 521
-    km['K'] = 522
-    km['L'] = 523
-    km['M'] = 524
-    km['N'] = 525
-    km['O'] = 526
-    km['P'] = 527
-    km['Q'] = 528
-    km['R'] = 529
-    km['S'] = 530
-    km['T'] = 531
-    km['U'] = 532
-    km['V'] = 533
-    km['W'] = 534
-    km['X'] = 535
-    km['Y'] = 536
-    km['Z'] = 537
-    km['<'] = 1293
-    km['>'] = 1294
-    km['{'] = 1315
-    km['}'] = 1316
-    return km
+#GraphicProvider per id(ctx), and loaded menu graphics by file URL
+_graphic_providers = {}
+_graphic_cache = {}
+
+def get_graphic(ctx, smgr, filename):
+    'Return the graphic for filename in TOOLBAR_GRAPHICS_DIR, loading it once'
+    url = uno.systemPathToFileUrl(os.path.join(TOOLBAR_GRAPHICS_DIR, filename))
+    graphic = _graphic_cache.get(url)
+    if graphic is None:
+        provider = _graphic_providers.get(id(ctx))
+        if provider is None:
+            provider = _graphic_providers[id(ctx)] = smgr.createInstanceWithContext(
+                'com.sun.star.graphic.GraphicProvider', ctx)
+        graphic = _graphic_cache[url] = provider.queryGraphic((PropertyValue(Name = 'URL', Value = url), ))
+    return graphic
+
+#Accelerator key name -> com.sun.star.awt.Key code
+_KEY_MAP = {
+    '0': 256, '1': 257, '2': 258, '3': 259, '4': 260,
+    '5': 261, '6': 262, '7': 263, '8': 264, '9': 265,
+    'A': 512, 'B': 513, 'C': 514, 'D': 515, 'E': 516, 'F': 517, 'G': 518,
+    'H': 519, 'I': 520, 'J': 521, 'K': 522, 'L': 523, 'M': 524, 'N': 525,
+    'O': 526, 'P': 527, 'Q': 528, 'R': 529, 'S': 530, 'T': 531, 'U': 532,
+    'V': 533, 'W': 534, 'X': 535, 'Y': 536, 'Z': 537,
+    '<': 1293, '>': 1294, '{': 1315, '}': 1316,
+}
+
+#Modifier name -> bits or'ed into KeyEvent.Modifiers
+_MOD_MAP = {'Ctr': 2, 'Shift': 1, 'Alt': 3}
 
 def create_key_event(ctx, smgr, key):
     'Create a key event for the menubar'
-    kv = uno.createUnoStruct('com.sun.star.awt.KeyEvent')
-    km = key_map()
-    #kv = smgr.createInstanceWithContext('com.sun.star.awt.KeyEvent', ctx)
-    keys = key.split(' ')
+    kv = KeyEvent()
     mod = 0
-    for k in keys:
-        if k == 'Ctr':
-            mod = mod | 2
-        elif k == 'Shift':
-            mod = mod | 1
-        elif k == 'Alt':
-            mod = mod | 3
-        elif k in km:
-            kv.KeyCode = km[k]
-            
+    for k in key.split(' '):
+        if k in _MOD_MAP:
+            mod |= _MOD_MAP[k]
+        elif k in _KEY_MAP:
+            kv.KeyCode = _KEY_MAP[k]
     kv.Modifiers = mod
     return kv
@@ -11,7 +11,7 @@ import os
 
 from librepy.pybrex.values import TOOLBAR_GRAPHICS_DIR
 from librepy.pybrex.msgbox import msgbox
-from librepy.pybrex.menubar import create_key_event
+from librepy.pybrex.menubar import create_key_event, get_graphic
 from librepy.pybrex.my_mri import mri
 
 from com.sun.star.awt import XMouseListener, KeyEvent, Point, Rectangle
@@ -83,13 +83,7 @@ class PopupMenu(object):
                     parent.setCommand(menu_item.id, menu_item.cmd)
                 #Set graphic
                 if menu_item.graphic is not None:
-                    graphic_provider = smgr.createInstanceWithContext('com.sun.star.graphic.GraphicProvider', ctx)
-                    g_dir = os.path.join(TOOLBAR_GRAPHICS_DIR, menu_item.graphic)
-                    prop_value = PropertyValue()
-                    prop_value.Name = 'URL'
-                    prop_value.Value = uno.systemPathToFileUrl(g_dir)
-                    graphic = graphic_provider.queryGraphic((prop_value, ))
-                    parent.setItemImage(menu_item.id, graphic, True)
+                    parent.setItemImage(menu_item.id, get_graphic(ctx, smgr, menu_item.graphic), True)
                 if menu_item.key:
                     parent.setAcceleratorKeyEvent(menu_item.id, create_key_event(ctx, smgr, menu_item.key))
                 #Recursively create the sub menus
@@ -9,6 +9,10 @@ import datetime
 import logging
 import uno
 
+# Struct classes resolved once by the pyuno import hook; constructing through
+# them skips the per-call type name lookup of uno.createUnoStruct
+from com.sun.star.util import Date as UnoDate, DateTime as UnoDateTime, Time as UnoTime
+
 logger = logging.getLogger(__name__)
 
 def python_date_to_uno(py_date):
@@ -25,11 +29,7 @@ def python_date_to_uno(py_date):
         return None
         
     try:
-        uno_date = uno.createUnoStruct("com.sun.star.util.Date")
-        uno_date.Year = py_date.year
-        uno_date.Month = py_date.month
-        uno_date.Day = py_date.day
-        return uno_date
+        return UnoDate(Year=py_date.year, Month=py_date.month, Day=py_date.day)
     except Exception as e:
         logger.error("Error converting date %s to UNO struct: %s" % (str(py_date), str(e)))
         return None
@@ -48,15 +48,15 @@ def python_datetime_to_uno(py_datetime):
         return None
         
     try:
-        uno_datetime = uno.createUnoStruct("com.sun.star.util.DateTime")
-        uno_datetime.Year = py_datetime.year
-        uno_datetime.Month = py_datetime.month
-        uno_datetime.Day = py_datetime.day
-        uno_datetime.Hours = py_datetime.hour
-        uno_datetime.Minutes = py_datetime.minute
-        uno_datetime.Seconds = py_datetime.second
-        uno_datetime.NanoSeconds = py_datetime.microsecond * 1000
-        return uno_datetime
+        return UnoDateTime(
+            Year=py_datetime.year,
+            Month=py_datetime.month,
+            Day=py_datetime.day,
+            Hours=py_datetime.hour,
+            Minutes=py_datetime.minute,
+            Seconds=py_datetime.second,
+            NanoSeconds=py_datetime.microsecond * 1000
+        )
     except Exception as e:
         logger.error("Error converting datetime %s to UNO struct: %s" % (str(py_datetime), str(e)))
         return None
@@ -75,12 +75,12 @@ def python_time_to_uno(py_time):
         return None
         
     try:
-        uno_time = uno.createUnoStruct("com.sun.star.util.Time")
-        uno_time.Hours = py_time.hour
-        uno_time.Minutes = py_time.minute
-        uno_time.Seconds = py_time.second
-        uno_time.NanoSeconds = py_time.microsecond * 1000 if hasattr(py_time, 'microsecond') else 0
-        return uno_time
+        return UnoTime(
+            Hours=py_time.hour,
+            Minutes=py_time.minute,
+            Seconds=py_time.second,
+            NanoSeconds=py_time.microsecond * 1000 if hasattr(py_time, 'microsecond') else 0
+        )
     except Exception as e:
         logger.error("Error converting time %s to UNO struct: %s" % (str(py_time), str(e)))
         return None